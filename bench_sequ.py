@@ -0,0 +1,266 @@
+#!/usr/bin/python
+
+# Copyright (c) 2013, Jason Nelson
+#
+# bench_sequ.py : written in python 2.7
+#
+# Benchmarks for sequ.py.  Runs sequ for every format word, with and without each of the options that
+# change how elements are formatted (-w, -p, -P, -f, -s, -n), at several sizes.  For each run it records
+# the elements per second, megabytes per second and peak memory, and it also measures start-up time.
+# The results are written to a JSON file so runs on different revisions can be compared:
+#
+#     python bench_sequ.py --output before.json
+#     (change sequ.py)
+#     python bench_sequ.py --output after.json --compare before.json
+#
+# Try 'python bench_sequ.py --help' for the other options.
+
+import sys
+import os
+import json
+import time
+import tempfile
+import platform
+import subprocess
+
+import sequ
+
+sequ_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sequ.py')
+
+default_sizes = [1000, 100000, 1000000]
+default_repeat = 3
+default_output = 'bench_output.json'
+
+#Options tried with every format word, and those only tried with floating
+common_options = [[], ['-w'], ['-p', '0'], ['-P'], ['-s', ',']]
+float_options = [['-f', '%.3f']]
+
+#Print benchmark help information
+def print_help():
+	print "Usage: bench_sequ.py [option].."
+	print " "
+	print "Runs sequ.py over every format word and option and reports elements/sec, MB/s,"
+	print "peak memory and start-up time."
+	print " "
+	print "Options: "
+	print "		--sizes [n,n,..]	    number of elements to generate (default 1000,100000,1000000)"
+	print "		--repeat [n]		    runs of each case, the fastest is kept (default 3)"
+	print "		--output [file]		    where to write the results (default bench_output.json)"
+	print "		--compare [file]	    compare against results saved by an earlier run"
+	print "		--python [command]	    python to run sequ.py with (default this one)"
+	print "\n"
+
+#Arguments that give a sequence of about n elements for the format word.  Alphabets and roman numerals
+#can not be longer than 26 and 3999 elements.
+def sequence_args(format_word, n):
+	if format_word == 'arabic':
+		return ['1', str(n)]
+	elif format_word == 'floating':
+		return ['0', '0.01', '%.2f' % ((n - 1) / 100.0)]
+	elif format_word == 'alpha':
+		return ['a', 'z']
+	elif format_word == 'ALPHA':
+		return ['A', 'Z']
+	elif format_word == 'roman':
+		return ['-F', 'roman', 'i', sequ.int_to_roman(min(n, 3999)).lower()]
+	else:
+		return ['-F', 'ROMAN', 'I', sequ.int_to_roman(min(n, 3999))]
+
+#First and Increment used to number lines with the format word
+def numbering_args(format_word):
+	if format_word == 'arabic':
+		return ['1', '1']
+	elif format_word == 'floating':
+		return ['1.0', '0.5']
+	elif format_word == 'alpha':
+		return ['a', '1']
+	elif format_word == 'ALPHA':
+		return ['A', '1']
+	elif format_word == 'roman':
+		return ['-F', 'roman', 'i', 'i']
+	else:
+		return ['-F', 'ROMAN', 'I', 'I']
+
+#Run sequ with 'args', the standard input read from the file named 'stdin' if given.  Returns the
+#wall clock time, the number of bytes written and the peak memory (kB) of the run.
+def run_sequ(python, args, stdin=None):
+	out = tempfile.TemporaryFile()
+	if stdin is not None:
+		stdin = open(stdin, 'rb')
+
+	started = time.time()
+	process = subprocess.Popen([python, sequ_path] + args, stdin=stdin, stdout=out)
+	pid, status, usage = os.wait4(process.pid, 0)
+	elapsed = time.time() - started
+
+	if stdin is not None:
+		stdin.close()
+	out.seek(0, 2)
+	size = out.tell()
+	out.close()
+
+	if status != 0:
+		print "sequ " + ' '.join(args) + ": failed"
+		exit(1)
+
+	return elapsed, size, usage.ru_maxrss
+
+#Write a file of n short lines for the numbering benchmarks, and return its name
+def make_input(n):
+	handle, path = tempfile.mkstemp(prefix='bench_sequ')
+	out = os.fdopen(handle, 'wb')
+	for i in xrange(n):
+		out.write('line %d of the benchmark input\n' % i)
+	out.close()
+	return path
+
+#Every case to run for a size: (name, arguments, number of elements, numbering input or None)
+def benchmark_cases(n, numbering_input):
+	cases = []
+	seen = set()
+
+	for format_word in ['arabic', 'floating', 'alpha', 'ALPHA', 'roman', 'ROMAN']:
+		args = sequence_args(format_word, n)
+		options = common_options
+		if format_word == 'floating':
+			options = common_options + float_options
+
+		for option in options:
+			name = ' '.join([format_word] + option + args[-2:])
+			if name in seen:
+				continue
+			seen.add(name)
+
+			if format_word in ['roman', 'ROMAN']:
+				elements = sequ.Sequence(args[2], args[3], format_word=format_word).length
+			elif len(args) == 3:
+				elements = sequ.Sequence(args[0], args[2], args[1]).length
+			else:
+				elements = sequ.Sequence(args[0], args[1]).length
+			cases.append((name, option + args, elements, None))
+
+		for option in [[]] + options[1:4]:
+			args = ['-n'] + option + numbering_args(format_word)
+			cases.append((' '.join([format_word, '-n'] + option), args, n, numbering_input))
+
+	return cases
+
+#Time starting sequ for a one element sequence, the fastest of 'repeat' runs
+def startup_time(python, repeat):
+	best = None
+	for i in range(repeat * 3):
+		elapsed, size, memory = run_sequ(python, ['1', '1'])
+		if best is None or elapsed < best:
+			best = elapsed
+	return best
+
+#Revision of the sequ.py being measured, if it is in a git checkout
+def revision():
+	try:
+		git = subprocess.Popen(['git', 'rev-parse', '--short', 'HEAD'], stdout=subprocess.PIPE, stderr=open(os.devnull, 'w'),
+			cwd=os.path.dirname(sequ_path))
+		return git.communicate()[0].strip() or None
+	except OSError:
+		return None
+
+#Run every case at every size and return the results
+def run_benchmarks(python, sizes, repeat):
+	results = {
+		'revision': revision(),
+		'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+		'python': subprocess.check_output([python, '-c', 'import platform; print platform.python_version()']).strip(),
+		'machine': platform.platform(),
+		'startup_seconds': startup_time(python, repeat),
+		'cases': [],
+	}
+	print "start-up: %.1f ms" % (results['startup_seconds'] * 1000)
+	print "%-40s %10s %14s %10s %10s" % ('case', 'elements', 'elements/sec', 'MB/s', 'peak kB')
+
+	for n in sizes:
+		numbering_input = make_input(n)
+		try:
+			for name, args, elements, stdin in benchmark_cases(n, numbering_input):
+				best = None
+				for i in range(repeat):
+					run = run_sequ(python, args, stdin)
+					if best is None or run[0] < best[0]:
+						best = run
+
+				elapsed, size, memory = best
+				result = {
+					'name': name,
+					'size': n,
+					'args': args,
+					'elements': elements,
+					'bytes': size,
+					'seconds': elapsed,
+					'elements_per_second': elements / elapsed,
+					'mb_per_second': size / elapsed / 1e6,
+					'peak_memory_kb': memory,
+				}
+				results['cases'].append(result)
+				print "%-40s %10d %14.0f %10.2f %10d" % (name, elements, result['elements_per_second'], result['mb_per_second'], memory)
+		finally:
+			os.remove(numbering_input)
+
+	return results
+
+#Print how each case changed from the results in 'old'
+def compare(old, new):
+	before = dict(((case['name'], case['size']), case) for case in old['cases'])
+
+	print " "
+	print "compared with %s (%s):" % (old.get('revision'), old.get('date'))
+	print "start-up: %.1f ms -> %.1f ms" % (old['startup_seconds'] * 1000, new['startup_seconds'] * 1000)
+	print "%-40s %10s %14s %14s %8s" % ('case', 'elements', 'before/sec', 'after/sec', 'change')
+
+	for case in new['cases']:
+		key = (case['name'], case['size'])
+		if key in before:
+			was = before[key]['elements_per_second']
+			now = case['elements_per_second']
+			print "%-40s %10d %14.0f %14.0f %+7.1f%%" % (case['name'], case['elements'], was, now, (now / was - 1) * 100)
+
+def main():
+	sizes = default_sizes
+	repeat = default_repeat
+	output = default_output
+	baseline = None
+	python = sys.executable
+
+	args = sys.argv[1:]
+	i = 0
+	while i < len(args):
+		arg = args[i]
+		if arg == '-h' or arg == '--help':
+			print_help()
+			exit(0)
+		elif arg in ['--sizes', '--repeat', '--output', '--compare', '--python'] and i + 1 < len(args):
+			value = args[i+1]
+			if arg == '--sizes':
+				sizes = [int(n) for n in value.split(',')]
+			elif arg == '--repeat':
+				repeat = int(value)
+			elif arg == '--output':
+				output = value
+			elif arg == '--compare':
+				baseline = json.load(open(value))
+			else:
+				python = value
+			i = i + 2
+		else:
+			print str(arg) + ": Invalid option"
+			exit(1)
+
+	results = run_benchmarks(python, sizes, repeat)
+
+	out = open(output, 'w')
+	json.dump(results, out, indent=1, sort_keys=True)
+	out.close()
+	print "results written to " + output
+
+	if baseline is not None:
+		compare(baseline, results)
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,119 @@
+#!/usr/bin/python
+
+# Copyright (c) 2013, Jason Nelson
+#
+# sequ_client.py : written in python 2.7
+#
+# Client for a sequ server.  Runs sequ with the given options and arguments on a server started with
+# 'sequ --serve socket', and prints the result exactly as sequ would, exiting with the same status:
+#
+#     python sequ.py --serve /tmp/sequ.sock &
+#     python sequ_client.py /tmp/sequ.sock -w 1 10
+#
+# With -n, or --batch -, the lines to number or the batch are read from standard input and sent to the server.  Files named with
+# --output or --output-prefix are written by the server, relative to the directory it was started in.
+
+import sys
+import os
+import errno
+import signal
+import json
+import socket
+import struct
+import threading
+
+#Send standard input to the server, then close our side of the connection
+def send_input(connection):
+	try:
+		while True:
+			block = os.read(sys.stdin.fileno(), 1 << 16)
+			if not block:
+				break
+			connection.sendall(block)
+		connection.shutdown(socket.SHUT_WR)
+	except socket.error:
+		pass #the server has stopped reading, its answer says why
+
+#Read exactly 'size' bytes from the connection, or fewer if it is closed
+def read_exactly(connection, size):
+	data = []
+	while size > 0:
+		block = connection.recv(min(size, 1 << 16))
+		if not block:
+			break
+		data.append(block)
+		size -= len(block)
+	return ''.join(data)
+
+#Print the frames the server sends back until the exit status, and return that
+def read_frames(connection):
+	while True:
+		header = read_exactly(connection, 5)
+		if len(header) < 5:
+			print "sequ_client: the server closed the connection"
+			return 1
+
+		kind = header[0]
+		data = read_exactly(connection, struct.unpack('>I', header[1:])[0])
+		if kind == 'o':
+			sys.stdout.write(data)
+		elif kind == 'e':
+			sys.stderr.write(data)
+		else:
+			return int(data)
+
+#Does the command line 'args' read standard input (to number lines, or as the batch file)?
+def reads_input(args):
+	if '-n' in args or '--number-lines' in args:
+		return True
+	for i in range(len(args) - 1):
+		if args[i] == '--batch' and args[i+1] == '-':
+			return True
+	return False
+
+#Finish quietly after the reader of standard output has gone away, as sequ does: standard output is pointed
+#at /dev/null, so python does not fail again flushing it, and the status is the one SIGPIPE would give
+def closed_output():
+	devnull = os.open(os.devnull, os.O_WRONLY)
+	os.dup2(devnull, sys.stdout.fileno())
+	os.close(devnull)
+	return 128 + signal.SIGPIPE
+
+def main():
+	if len(sys.argv) < 2 or sys.argv[1] in ['-h', '--help']:
+		print "Usage: sequ_client.py socket [option].. First Last"
+		print " "
+		print "Runs sequ, with the same options and arguments, on a server started with sequ --serve socket"
+		print "\n"
+		return 1
+
+	args = sys.argv[2:]
+
+	connection = socket.socket(socket.AF_UNIX)
+	try:
+		connection.connect(sys.argv[1])
+	except socket.error as error:
+		print sys.argv[1] + ": Error, can not reach the server: " + str(error)
+		return 1
+
+	connection.sendall(json.dumps(args) + '\n')
+
+	#The input is sent from another thread, so large outputs can come back while it is still being sent
+	if reads_input(args):
+		sender = threading.Thread(target=send_input, args=(connection,))
+		sender.daemon = True
+		sender.start()
+	else:
+		connection.shutdown(socket.SHUT_WR)
+
+	try:
+		return read_frames(connection)
+	except IOError as error:
+		if error.errno != errno.EPIPE:
+			raise
+		return closed_output()
+	finally:
+		connection.close()
+
+if __name__ == '__main__':
+	exit(main())
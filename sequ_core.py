@@ -0,0 +1,3032 @@
+#!/usr/bin/python
+
+# Copyright (c) 2013, Jason Nelson
+#
+# sequ_core.py : written in python 2.7
+# 
+# This is my implementation of compliance level 4 of the sequ command (universal sequence.)
+# It accepts two number arguments, or an optional third, as well as any number of valid options.
+# The program outputs an inclusive sequence of numbers between the first and last arguments, and
+# will increment the values by the increment argument if present (default increment is 1 if third
+# argument is missing.)  
+#
+# Options include format, seperator, equal-width, help, version, words, pad, pad-spaces, format-word,
+# and number-lines.    
+#
+# For more details about program usage, try running the program with a '-h' or '--help' option.
+#
+# This module holds all of sequ; sequ.py is the small script that runs it, so the interpreter can load this
+# module's cached bytecode instead of compiling it on every run.  Either name can be imported as a library
+# ('import sequ' gives this module).  Sequence takes the same arguments as the command line,
+# and iter_sequence, iter_chunks and iter_numbered produce its output lazily, e.g.
+#
+#     for chunk in sequ.iter_chunks(1, 1000000, equal_width=True):
+#         out.write(chunk)
+#
+# Passing a Stats as 'stats' to iter_chunks (or Sequence.chunks and write_chunks) times each phase of the
+# run, as the --stats option does; its summary() method returns the figures.
+
+import sys
+import os
+import re
+import errno
+import time
+import stat
+from functools import partial
+from operator import methodcaller
+from itertools import imap, izip, islice, count, takewhile, chain, repeat
+
+#Size, in bytes, of the batches handed to the output stream.  Set by the buffer-size option.
+output_buffer_size = 65536
+
+#Size, in bytes, of the blocks of output each worker process formats at a time.  See parallel_chunks.
+parallel_block_size = 1 << 20
+
+#Roman numeral lookup tables, built by roman_tables() the first time they are needed
+roman_table_cache = None
+
+#Tables of the letter sequences of up to three letters, built by alpha_tables() the first time they are needed
+alpha_table_cache = None
+
+#Sequences already built for clients of the server, by their arguments, so repeated requests skip checking
+#the arguments and planning the formatter.  None when not serving.
+sequence_cache = None
+sequence_cache_size = 1024
+
+#The numpy module, imported by load_numpy() the first time it could be used (None if it is not installed)
+numpy_cache = False
+
+#Arabic and floating sequences of at least this many elements are formatted with numpy, if it is installed.
+#Shorter ones are not worth the time it takes to import it.
+numpy_min_elements = 100000
+
+#Number of files numbered at the same time, unless the jobs option says otherwise
+file_jobs = 4
+
+#Chunks of output each file being numbered may have waiting to be written.  See queued_file_chunks.
+file_queue_depth = 16
+
+#Least number of seconds between the records of the checkpoint option.  See write_checkpointed.
+checkpoint_interval = 5.0
+
+#Size, in bytes, of the blocks of output compressed at a time by the compress option.  See compressed_chunks.
+compress_block_size = 1 << 20
+
+#Largest number of bytes the cache option keeps in its directory, unless the cache-size option says otherwise
+cache_max_bytes = 1 << 30
+
+#Seconds after which a file left half written in the cache directory (by a run that was killed) is removed
+cache_stale_seconds = 86400
+
+#The sendfile function, found by load_sendfile() the first time a cached output is sent (None if there is none)
+sendfile_cache = False
+
+#The lzma module, imported by load_lzma() the first time xz output is asked for (None if it is not installed)
+lzma_cache = False
+
+#An error in the arguments or options of a sequence.  The command line prints the message and exits
+#with status 1.
+class SequError(Exception):
+	pass
+
+#Check if a commmand-line argument is a help option
+def help_check(arg):
+	if arg == '-h' or arg == '--help':
+		return True
+	else:
+		return False
+
+#Check if a command-line argument is a version option
+def version_check(arg):
+	if arg == '-v' or arg == '--version':
+		return True
+	else:
+		return False
+
+#Print sequ help information (to 'out', stdout by default)
+def print_help(out=None):
+	print >>out, "Usage: sequ [option].. First Last"
+	print >>out, "  Or:  sequ [option].. First Increment Last"
+	print >>out, "  Or:  sequ [option].. First Increment (If number-lines is a chosen option)"
+	print >>out, "  Or:  sequ [option].. First Increment file.. (to number files instead of the input)"
+	print >>out, " "
+	print >>out, "Prints numbers from First to Last in steps of Increment"
+	print >>out, " "
+	print >>out, "Options: "
+	print >>out, "		-f, --format [format_string]        use printf style floating-point format"
+	print >>out, "		-s, --seperator [seperator_string]  use seperator_string to seperate numbers"
+	print >>out, "		-w, --equal-width		    equalize width by padding with zeroes"
+	print >>out, "		-h, --help			    display help and exit"
+	print >>out, "		-v, --version			    display version information and exit"
+	print >>out, "		-W, --words			    use ' ' to seperate numbers"
+	print >>out, "		-p, --pad [pad_string]		    equalize width by padding with pad_string"
+	print >>out, "		-P, --pad-spaces		    equalize width by padding with spaces"
+	print >>out, "		-F, --format-word [format_string]   print alternate sequences of numbers."
+	print >>out, "						    format_string must be 'arabic', 'floating', "
+	print >>out, "						    'alpha', 'ALPHA', 'roman', or 'ROMAN' "
+	print >>out, "		-n, --number-lines		    number lines of a text file presented on the input."
+	print >>out, "						    The first line in the file will be numbered with First, and each"
+	print >>out, "						    subsequent line will be numbered with the chosen sequence."		    		
+	print >>out, "		-b, --buffer-size [bytes]	    write output in batches of about this many bytes"
+	print >>out, "		-j, --jobs [N]			    format the sequence in N processes at once, or number N"
+	print >>out, "						    files at once (default 4), or number an input redirected"
+	print >>out, "						    from a file in N processes"
+	print >>out, "		    --output-suffix [suffix]	    write each numbered file to its name plus suffix,"
+	print >>out, "						    instead of all of them to the output in order"
+	print >>out, "		    --split-lines [N]		    write the sequence into files of N elements each, named"
+	print >>out, "		    --output-prefix [prefix]	    prefix00, prefix01, ... (see --output-prefix)"
+	print >>out, "		    --skip [N]			    leave out the first N elements of the sequence"
+	print >>out, "		    --count [M]			    print at most M elements.  Widths are still worked"
+	print >>out, "						    out from the whole sequence, so parts line up."
+	print >>out, "		    --output [file]		    write the sequence to file.  With -w, -p or -P the file is"
+	print >>out, "						    filled in place (by N processes with --jobs)"
+	print >>out, "		    --compress [method]	    compress the output file with 'gzip' or 'xz', in"
+	print >>out, "						    blocks compressed by one thread per CPU"
+	print >>out, "		    --elements			    only print how many elements (or lines) would be written"
+	print >>out, "		    --bytes			    only print how many bytes would be written.  Both are worked"
+	print >>out, "						    out without writing the sequence."
+	print >>out, "		    --pipeline [N]		    format the output in a thread of its own, at most N"
+	print >>out, "						    chunks ahead of the writing"
+	print >>out, "		    --cache [directory]	    keep the output in directory, and print it from there"
+	print >>out, "						    when the same sequence is asked for again"
+	print >>out, "		    --cache-size [bytes]	    most bytes to keep in the cache (default 1 GB); the"
+	print >>out, "						    outputs used longest ago are removed first"
+	print >>out, "		    --stats			    report the time spent in each phase, the elements and"
+	print >>out, "						    bytes written and peak memory on standard error"
+	print >>out, "		    --serve [socket]		    run as a server on a unix socket, taking the same"
+	print >>out, "						    arguments from clients (see sequ_client.py)"
+	print >>out, "		    --batch [file]		    print the sequence of each line of file (- for the input),"
+	print >>out, "						    each line holding options and arguments as above"
+	print >>out, "		    --delimiter [string]	    print string between the sequences of a batch"
+	print >>out, "						    (with --jobs N, N sequences are worked out at once)"
+	print >>out, "		    --checkpoint [file]	    record in file how much of the sequence has been written"
+	print >>out, "		    --resume [file]		    carry on the run recorded in file, from the next element"
+	print >>out, "						    (takes no other arguments)"
+	print >>out, "\n"
+
+#Print sequ version information (to 'out', stdout by default)
+def print_version(out=None):
+	print >>out, "sequ 1.0"
+	print >>out, "Copyright (C) 2013, Jason Nelson"
+	print >>out, "\n"
+
+#Checks if a command-line argument is a number, either integer or floating type is fine.
+#http://stackoverflow.com/questions/354038/how-do-i-check-if-a-string-is-a-number-in-python
+def number_check(arg):
+	try:
+		int(arg)
+	except ValueError:
+		try:
+			float(arg)
+		except ValueError:
+			return False
+
+	return True
+
+#Check if the argument is a character, or a sequence of them (aa, ab, ...)
+def char_check(arg):
+	if arg.isalpha():
+		return True
+	else:
+		return False
+
+#Check if the argument could be a reasonable roman numeral
+def roman_check(arg):
+	length = len(arg)
+
+	arg = arg.upper()
+
+	for i in range(0, length):
+		if arg[i] not in ['I', 'V', 'X', 'M', 'C', 'D', 'L']:
+			return False
+	
+	return True
+	
+#Check if an argument is a number, character, or roman numeral
+def valid_arg_check(arg):
+	if number_check(arg) or char_check(arg) or roman_check(arg):
+		return True
+	else:
+		return False
+
+
+
+#Check if a command-line argument is an integer.
+#http://stackoverflow.com/questions/354038/how-do-i-check-if-a-string-is-a-number-in-python
+def is_int(arg):
+	try:
+		int(arg)
+	except ValueError:
+		return False
+	return True
+
+# Can the string be represented as a float?
+def is_float(arg):
+	try:
+		float(arg)
+	except ValueError:
+		return False
+	return True
+
+#Can the string be represented as a lower case char?
+def is_lower_char(arg):	
+	if len(arg) != 1:
+		return False
+
+	int_val = ord(arg)
+
+	if int_val >= ord('a') and int_val <= ord('z'):
+		return True
+	else:
+		return False	
+
+#Can the string be represented as an upper case char?
+def is_upper_char(arg):
+	if len(arg) != 1:
+		return False
+
+	int_val = ord(arg)
+
+	if int_val >= ord('A') and int_val <= ord('Z'):
+		return True
+	else:
+		return False
+
+#Can the string be represented as lower case letters (a, z, aa, ...)?
+def is_lower_alpha(arg):
+	if len(arg) == 0:
+		return False
+
+	for char in arg:
+		if not is_lower_char(char):
+			return False
+	return True
+
+#Can the string be represented as upper case letters (A, Z, AA, ...)?
+def is_upper_alpha(arg):
+	if len(arg) == 0:
+		return False
+
+	for char in arg:
+		if not is_upper_char(char):
+			return False
+	return True
+
+#Can the string be represented as a lower case roman numeral?
+def is_lower_roman(arg):
+	length = len(arg)
+
+	for i in range(0, length):
+		if arg[i] not in ['i', 'v', 'x', 'm', 'c', 'd', 'l']:
+			return False
+	return True  
+
+#Can the string be represented as an upper case roman numeral?
+def is_upper_roman(arg):
+	length = len(arg)
+
+	for i in range(0, length):
+		if arg[i] not in ['I', 'V', 'X', 'M', 'C', 'D', 'L']:
+			return False
+	return True
+
+#Is this integer increment reasonable?
+def int_increment_check(arg):
+	if arg[0] == '-':
+		if arg[1:].isdigit():
+			return True
+	if arg.isdigit():
+		return True
+	else:
+		return False
+
+#Every option, by each of its names: the name it is handled by, and whether a value follows it
+option_table = {
+	'-h': ('help', False), '--help': ('help', False),
+	'-v': ('version', False), '--version': ('version', False),
+	'-s': ('seperator', True), '--seperator': ('seperator', True),
+	'-f': ('format', True), '--format': ('format', True),
+	'-w': ('equal-width', False), '--equal-width': ('equal-width', False),
+	'-W': ('words', False), '--words': ('words', False),
+	'-p': ('pad', True), '--pad': ('pad', True),
+	'-P': ('pad-spaces', False), '--pad-spaces': ('pad-spaces', False),
+	'-F': ('format-word', True), '--format-word': ('format-word', True),
+	'-n': ('number-lines', False), '--number-lines': ('number-lines', False),
+	'-b': ('buffer-size', True), '--buffer-size': ('buffer-size', True),
+	'--skip': ('skip', True), '--count': ('count', True),
+	'-j': ('jobs', True), '--jobs': ('jobs', True),
+	'--split-lines': ('split-lines', True), '--output-prefix': ('output-prefix', True),
+	'--output': ('output', True),
+	'--output-suffix': ('output-suffix', True),
+	'--elements': ('elements', False), '--bytes': ('bytes', False),
+	'--stats': ('stats', False),
+	'--pipeline': ('pipeline', True),
+	'--cache': ('cache', True), '--cache-size': ('cache-size', True),
+	'--checkpoint': ('checkpoint', True),
+	'--compress': ('compress', True),
+	'--batch': ('batch', True), '--delimiter': ('delimiter', True),
+}
+
+#Check if a command-line argument is a valid/reasonable option
+def option_check(arg):
+	#Make sure it's not an empty string before checking if it is an option.
+	if arg == "":
+		raise SequError("Invalid option: empty string detected")
+
+	#If it is a valid option, return true
+	if arg in option_table:
+		return True
+	elif arg[0] == '-':
+		raise SequError(str(arg) + ": Invalid option")
+	else: 
+		return False
+
+#Split a command line into its options and arguments, looking at each word once.  Options come first, each
+#taking the word after it if it has a value, whatever that word looks like.  The arguments are the numbers,
+#characters or roman numerals at the end, up to three of them; any other word is an invalid option.  When
+#numbering lines, any words after First and Increment are the names of files to number.  Returns a list of
+#(option name, value) pairs, the value None for options without one, the arguments and the files.
+def parse_command_line(argv):
+	options = []
+	i = 1
+	while i < len(argv) and argv[i] in option_table:
+		option, has_value = option_table[argv[i]]
+		if has_value and i + 1 < len(argv):
+			options.append((option, argv[i+1]))
+			i = i + 2
+		else:
+			#A missing value can only be at the end, which leaves too few arguments
+			options.append((option, None))
+			i = i + 1
+
+	rest = argv[i:]
+	if ('number-lines', None) in options and len(rest) > 2 and valid_arg_check(rest[0]) and valid_arg_check(rest[1]):
+		return options, rest[:2], rest[2:]
+
+	#Count back from the end for the arguments
+	arg_count = 0
+	while arg_count < min(3, len(rest)) and valid_arg_check(rest[-arg_count-1]):
+		arg_count = arg_count + 1
+
+	for arg in rest[:len(rest)-arg_count]:
+		option_check(arg)
+		raise SequError(str(arg) + ": Invalid option")
+
+	return options, rest[len(rest)-arg_count:], []
+
+#Join the elements of 'elements' into strings of about buffer_size bytes (default output_buffer_size),
+#each element followed by 'sep', so the output can be written in bulk instead of once per element.
+def render_chunks(elements, sep, buffer_size=None):
+	if buffer_size is None:
+		buffer_size = output_buffer_size
+
+	elements = iter(elements)
+	batch = 64 #number of elements in the next chunk, adjusted as we learn how long the elements are
+
+	while True:
+		chunk = list(islice(elements, batch))
+		if not chunk:
+			break
+
+		text = sep.join(chunk) + sep
+		yield text
+
+		if len(text) > 0:
+			batch = max(1, batch * buffer_size // len(text))
+		else:
+			batch = batch * 2
+
+#Write each of the strings in 'chunks' to 'stream' (stdout by default).  With 'stats' (a Stats) the time
+#spent writing and the number of bytes written are added to it.  If writing fails (the reader of a pipe
+#has gone away, say) a generator of chunks is closed straight away, so the threads or processes behind it
+#are stopped before the error is passed on.
+def write_chunks(chunks, stream=None, stats=None):
+	try:
+		write_each_chunk(chunks, stream, stats)
+	except:
+		if hasattr(chunks, 'close'):
+			chunks.close()
+		raise
+
+#Do the writing for write_chunks
+def write_each_chunk(chunks, stream=None, stats=None):
+	if stream is None:
+		stream = sys.stdout
+
+	if stats is None:
+		for chunk in chunks:
+			stream.write(chunk)
+		return
+
+	for chunk in chunks:
+		started = time.time()
+		stream.write(chunk)
+		stats.add('write', time.time() - started)
+		stats.bytes += len(chunk)
+
+	started = time.time()
+	stream.flush()
+	stats.add('write', time.time() - started)
+
+#Import the lzma module the first time it is asked for, from the standard library or the backports.lzma
+#package.  Returns None if neither is installed.
+def load_lzma():
+	global lzma_cache
+
+	if lzma_cache is False:
+		try:
+			import lzma
+			lzma_cache = lzma
+		except ImportError:
+			try:
+				from backports import lzma
+				lzma_cache = lzma
+			except ImportError:
+				lzma_cache = None
+
+	return lzma_cache
+
+#Check that output can be compressed with 'method' ('gzip' or 'xz') here
+def check_compression(method):
+	if method not in ['gzip', 'xz']:
+		raise SequError(str(method) + ": Invalid compression method.")
+	if method == 'xz' and load_lzma() is None:
+		raise SequError("Error: xz compression needs the lzma module (pip install backports.lzma)")
+
+#Compress 'data' into one complete gzip member or xz stream, as 'method' says.  Members and streams can be
+#joined one after another, and gzip and xz read them back as one file.
+def compress_member(method, data):
+	if method == 'xz':
+		return load_lzma().compress(data)
+
+	import zlib
+	compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS) #a gzip header and trailer
+	return compressor.compress(data) + compressor.flush()
+
+#Join the strings in 'chunks' into blocks of at least block_size bytes (the last one may be shorter).  There
+#is always at least one block, empty if the chunks are.
+def gather_blocks(chunks, block_size):
+	pieces = []
+	size = 0
+	for chunk in chunks:
+		pieces.append(chunk)
+		size += len(chunk)
+		if size >= block_size:
+			yield ''.join(pieces)
+			pieces = []
+			size = 0
+
+	if pieces or size == 0:
+		yield ''.join(pieces)
+
+#Wait for a block handed to a thread by compressed_chunks and return it compressed, adding the time waited
+#to 'stats' if given
+def collect_compressed(result, stats):
+	#A timeout keeps the wait interruptible with Ctrl-C under python 2
+	if stats is None:
+		return result.get(86400)
+
+	started = time.time()
+	data = result.get(86400)
+	stats.add('compress', time.time() - started)
+	return data
+
+#Generate the strings in 'chunks' compressed with 'method' ('gzip' or 'xz'), for the compress option.  The
+#chunks are gathered into blocks of about block_size bytes (compress_block_size by default), each of which
+#is compressed on its own by a pool of 'threads' threads (one per CPU by default); zlib and lzma let go of
+#the interpreter lock while they work, so the blocks really are compressed at the same time.  At most two
+#blocks per thread are in flight, and they come out in order as members of one gzip or xz file.  With
+#'stats' the time spent waiting for the threads is added to it.
+def compressed_chunks(chunks, method, threads=None, block_size=None, stats=None):
+	from multiprocessing.pool import ThreadPool
+	import collections
+
+	check_compression(method)
+	if threads is None:
+		import multiprocessing
+		threads = multiprocessing.cpu_count()
+	if block_size is None:
+		block_size = compress_block_size
+
+	pending = collections.deque()
+	pool = ThreadPool(threads)
+
+	try:
+		for block in gather_blocks(chunks, block_size):
+			pending.append(pool.apply_async(compress_member, (method, block)))
+			if len(pending) >= 2 * threads:
+				yield collect_compressed(pending.popleft(), stats)
+
+		while pending:
+			yield collect_compressed(pending.popleft(), stats)
+	finally:
+		pool.terminate()
+
+#Work out the strings of 'chunks' for pipelined_chunks, in a thread of its own.  They are put on 'queue',
+#followed by None when they are done or by the error that stopped them.  Once 'stopped' is set no more are
+#worked out, and a generator of chunks is closed.
+def queue_chunks(queue, chunks, stopped):
+	try:
+		for chunk in chunks:
+			queue.put(chunk)
+			if stopped.is_set():
+				if hasattr(chunks, 'close'):
+					chunks.close()
+				return
+		queue.put(None)
+	except Exception as error:
+		queue.put(error)
+
+#Generate the strings of 'chunks', worked out by a thread of their own up to 'depth' chunks ahead of the
+#ones taken, so that formatting goes on while the output is blocked writing.  The queue between the two
+#threads holds at most 'depth' chunks, so a slow reader holds the formatting back rather than filling
+#memory.  If the chunks are not all taken (the output has gone away), the thread is stopped and waited for.
+def pipelined_chunks(chunks, depth):
+	import threading
+	import Queue
+
+	queue = Queue.Queue(depth)
+	stopped = threading.Event()
+	thread = threading.Thread(target=queue_chunks, args=(queue, chunks, stopped))
+	thread.daemon = True
+	thread.start()
+
+	try:
+		while True:
+			#A timeout keeps the wait interruptible with Ctrl-C under python 2
+			chunk = queue.get(True, 86400)
+			if chunk is None:
+				break
+			elif isinstance(chunk, Exception):
+				raise chunk
+			yield chunk
+	finally:
+		#Make room for the chunk the thread may be waiting to put, so it sees it has been stopped
+		stopped.set()
+		while not queue.empty():
+			queue.get_nowait()
+		thread.join(86400)
+
+#Timings and counts of a sequ run, as reported by the stats option.  Time spent in each phase is added up
+#with add(): 'parse' (checking the arguments and building the sequence), 'read' (reading the lines to be
+#numbered), 'generate' (working out the values of the elements), 'format' (turning them into text),
+#'workers' (waiting for worker processes, which generate and format together), 'compress' (waiting for the
+#threads compressing the output) and 'write'.
+class Stats(object):
+	phases = ['parse', 'read', 'generate', 'format', 'workers', 'compress', 'write']
+
+	def __init__(self, started=None):
+		if started is None:
+			started = time.time()
+		self.started = started
+		self.seconds = dict((phase, 0.0) for phase in Stats.phases)
+		self.elements = 0 #elements (or numbered lines) generated
+		self.bytes = 0 #bytes written
+
+	def add(self, phase, seconds):
+		self.seconds[phase] += seconds
+
+	#Return the figures so far as a dictionary: the seconds spent in each phase, the total seconds since
+	#the stats were started, elements, bytes, throughput and the peak memory in kB (None if unknown)
+	def summary(self):
+		total = time.time() - self.started
+		summary = {
+			'phases': dict(self.seconds),
+			'total_seconds': total,
+			'elements': self.elements,
+			'bytes': self.bytes,
+			'elements_per_second': None,
+			'bytes_per_second': None,
+			'peak_memory_kb': None,
+		}
+		if total > 0:
+			summary['elements_per_second'] = self.elements / total
+			summary['bytes_per_second'] = self.bytes / total
+
+		try:
+			import resource #not on every platform
+			summary['peak_memory_kb'] = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+				resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+		except ImportError:
+			pass
+
+		return summary
+
+	#Write the figures to 'stream' (stderr by default)
+	def report(self, stream=None):
+		if stream is None:
+			stream = sys.stderr
+
+		summary = self.summary()
+		print >>stream, "sequ stats:"
+		for phase in Stats.phases:
+			if summary['phases'][phase] > 0 or phase in ['parse', 'write']:
+				print >>stream, "  %-12s %12.6f s" % (phase, summary['phases'][phase])
+		print >>stream, "  %-12s %12.6f s" % ('total', summary['total_seconds'])
+		print >>stream, "  %-12s %12d" % ('elements', summary['elements'])
+		print >>stream, "  %-12s %12d" % ('bytes', summary['bytes'])
+		if summary['elements_per_second'] is not None:
+			print >>stream, "  %-12s %12.0f elements/s, %.2f MB/s" % ('throughput', summary['elements_per_second'],
+				summary['bytes_per_second'] / 1e6)
+		if summary['peak_memory_kb'] is not None:
+			print >>stream, "  %-12s %12d kB" % ('peak memory', summary['peak_memory_kb'])
+
+#Lazily generate the integers of range(start, stop, step).  xrange is used when the values fit in
+#a machine integer, otherwise the values are counted out one at a time.
+def int_range(start, stop, step):
+	try:
+		return xrange(start, stop, step)
+	except OverflowError:
+		if step > 0:
+			return takewhile(lambda i: i < stop, count(start, step))
+		else:
+			return takewhile(lambda i: i > stop, count(start, step))
+
+#Number of elements from first to last (inclusive) in steps of inc, all integers
+def range_length(first, last, inc):
+	if (inc > 0 and first > last) or (inc < 0 and first < last):
+		return 0
+	return (last - first) // inc + 1
+
+#Number of i from 0 to n-1 with lo <= first + i*inc <= hi
+def progression_count(first, inc, n, lo, hi):
+	if n <= 0 or lo > hi:
+		return 0
+	if inc < 0:
+		first, inc = first + (n-1) * inc, -inc
+
+	low = max(0, -((first - lo) // inc))
+	high = min(n - 1, (hi - first) // inc)
+	return max(0, high - low + 1)
+
+#Total number of characters of the integers first, first+inc, ... (n of them) written in decimal with
+#at least min_digits digits, counting their signs, worked out a band of equally long numbers at a time
+def digits_total(first, inc, n, min_digits=1):
+	if n <= 0:
+		return 0
+
+	last = first + (n-1) * inc
+	total = progression_count(first, inc, n, min(first, last), -1) #the signs
+	for digits in range(1, len(str(max(abs(first), abs(last)))) + 1):
+		high = 10**digits - 1
+		low = 10**(digits-1)
+		if digits == 1:
+			low = 0
+		band = progression_count(first, inc, n, low, high) + progression_count(first, inc, n, -high, -max(low, 1))
+		total += max(digits, min_digits) * band
+
+	return total
+
+#A number written out in decimal, with an optional sign, decimal point and exponent
+decimal_pattern = re.compile(r'\s*([-+]?)(\d*)(?:\.(\d*))?(?:[eE]([-+]?\d+))?\s*$')
+
+#Split the number 'arg' into its sign (True if negative), its digits as an integer and its exponent, so
+#that arg is digits * 10**exponent.  Numbers written out in decimal are read directly; the decimal module
+#is only imported for anything else float() accepts.  Infinities and NaN are refused.
+def decimal_parts(arg):
+	match = decimal_pattern.match(arg)
+	if match is not None and (match.group(2) or match.group(3)):
+		sign, whole, fraction, exponent = match.groups()
+		fraction = fraction or ''
+		return sign == '-', int(whole + fraction), int(exponent or 0) - len(fraction)
+
+	import decimal #slow to import, and only needed here
+	value = decimal.Decimal(arg)
+	if not value.is_finite():
+		raise SequError(str(arg).strip() + ": Error, not a finite number")
+
+	sign, digits, exponent = value.as_tuple()
+	return bool(sign), int(''.join(map(str, digits))), exponent
+
+#Convert the decimal string 'arg' to an exact integer count of 10**-prec units.  prec must be at
+#least the number of decimal places in arg (see highest_precision.)
+def scale_decimal(arg, prec):
+	negative, digits, exponent = decimal_parts(arg)
+	scaled = digits * 10 ** (exponent + prec)
+	if negative:
+		return -scaled
+	return scaled
+
+#Lazily generate the 'n' floating point values first, first+inc, first+2*inc, ... where first and inc
+#are scaled integers in units of 10**-prec.  Element i is computed as (first + i*inc) / 10**prec, so
+#no error builds up no matter how long the sequence is.  If n is None the values go on forever.
+def float_sequence(first, inc, n, prec):
+	limit = 2**53
+
+	#Count the leading values below 2**53.  Both operands of the division are exact doubles for
+	#those, so it rounds straight to the nearest value.  The rest are converted from a decimal string.
+	if prec > 22 or abs(first) >= limit:
+		exact = 0
+	elif inc > 0:
+		exact = (limit - 1 - first) // inc + 1
+	else:
+		exact = (first + limit - 1) // -inc + 1
+	if n is not None and exact > n:
+		exact = n
+
+	fast = imap(float(10 ** prec).__rdiv__, islice(count(first, inc), exact))
+	if n is None:
+		rest = count(first + exact * inc, inc)
+	else:
+		rest = int_range(first + exact * inc, first + n * inc, inc) #more than sys.maxint of them is fine
+
+	return chain(fast, (float('%de-%d' % (i, prec)) for i in rest))
+
+#Convert a roman numeral to an integer.  Every valid numeral is in the lookup table; anything
+#else is run through the routine below to find out what is wrong with it.
+def roman_to_int(arg):
+	values = roman_tables()[3]
+
+	if arg in values:
+		return values[arg]
+	elif arg.upper() in values:
+		return values[arg.upper()]
+
+	roman_value(arg)
+	raise SequError("Error, invalid roman numeral!")
+
+#I found this routine on: http://code.activestate.com/recipes/81611-roman-numerals/
+#It converts its argument from a roman numeral to an integer, without checking that it is
+#written the usual way
+def roman_value(arg):
+	arg = arg.upper()
+
+	rom_list = ['M', 'D', 'C', 'L', 'X', 'V', 'I']
+	int_list = [1000, 500, 100, 50, 10, 5, 1]
+	places = []
+
+	for c in arg:
+		if not c in rom_list:
+			raise SequError("Error, invalid roman numeral")
+	for i in range(len(arg)):
+		c = arg[i]
+		value = int_list[rom_list.index(c)]
+
+		try:
+			nextvalue = int_list[rom_list.index(arg[i+1])]
+			if nextvalue > value:
+				value *= -1
+		except IndexError:
+			pass
+
+		places.append(value)
+
+	sum = 0
+
+	for n in places:
+		sum += n
+
+	if sum < 1 or sum > 3999:
+		raise SequError("Error: roman numerals must be between 1 and 3999")
+	return sum
+
+#Convert an integer to a roman numeral (upper case) by looking it up
+def int_to_roman(arg):
+	if arg < 1 or arg > 3999:
+		raise SequError("Error: roman numerals must be between 1 and 3999")
+
+	return roman_tables()[0][arg]
+
+#I found this routine on: http://code.activestate.com/recipes/81611-roman-numerals/
+#It converts its argument from an integer to a roman numeral
+def roman_numeral(arg):
+	int_list = [1000, 900, 500, 400, 100, 90, 50, 40, 10, 9, 5, 4, 1]
+	rom_list = ['M', 'CM', 'D', 'CD', 'C', 'XC', 'L', 'XL', 'X', 'IX', 'V', 'IV', 'I']
+	result = ""
+
+	for i in range(len(int_list)):
+		count = int(arg / int_list[i])
+		result += rom_list[i] * count
+		arg -= int_list[i] * count
+	return result
+
+#Return the roman numeral lookup tables, building them the first time: the upper case and lower case
+#numerals for 0..3999 (0 is an empty string), the length of each, and a dictionary from every
+#numeral in either case back to its value.
+def roman_tables():
+	global roman_table_cache
+
+	if roman_table_cache is None:
+		upper = [''] + [roman_numeral(i) for i in range(1, 4000)]
+		lower = [numeral.lower() for numeral in upper]
+		widths = [len(numeral) for numeral in upper]
+
+		values = dict(izip(upper[1:], range(1, 4000)))
+		values.update(izip(lower[1:], range(1, 4000)))
+
+		roman_table_cache = (upper, lower, widths, values)
+
+	return roman_table_cache
+
+#Width of the widest roman numeral from start to end (inclusive) in steps of inc, read off the
+#table of lengths rather than rendering the numerals.  Values past 3999 are left out.
+def roman_width(start, end, inc):
+	widths = roman_tables()[2]
+	if end > 3999:
+		end = 3999
+	if start > end:
+		return 0
+
+	return max(widths[start:end+1:inc])
+
+#Convert letters (either case) to the integer they count to in bijective base 26, the way spreadsheet
+#columns are numbered: a is 1, z is 26, aa is 27, az is 52, ba is 53 and so on
+def alpha_to_int(arg):
+	value = 0
+	for char in arg.lower():
+		value = value * 26 + ord(char) - ord('a') + 1
+	return value
+
+#Convert an integer (1 or more) to its letters (lower case), the other way from alpha_to_int
+def int_to_alpha(arg):
+	if arg < 1:
+		raise SequError("Error: letters must count from a")
+
+	return alpha_converter(alpha_tables()[1])(arg)
+
+#Return the tables of letter sequences, building them the first time: the upper case and lower case
+#letters for 0..18278, every sequence of up to three letters (0 is an empty string)
+def alpha_tables():
+	global alpha_table_cache
+
+	if alpha_table_cache is None:
+		one = [chr(code) for code in range(ord('A'), ord('Z') + 1)]
+		two = [first + second for first in one for second in one]
+		three = [first + second for first in one for second in two]
+		upper = [''] + one + two + three
+		lower = [letters.lower() for letters in upper]
+
+		alpha_table_cache = (upper, lower)
+
+	return alpha_table_cache
+
+#Make a function converting integers to letters with 'table' (one of the alpha_tables()).  Up to three
+#letters are looked up.  Longer sequences end in the three letter one for the rest of their value after
+#aaa (703), with the letters for the number of whole rounds of three letters in front; those leading letters
+#only change every 17576 values, so they are carried over from the last one converted instead of being
+#worked out every time.
+def alpha_converter(table):
+	last = [(0, '')]
+
+	def convert(value):
+		if value < len(table):
+			return table[value]
+
+		rounds, rest = divmod(value - 703, 17576)
+		carried, letters = last[0]
+		if rounds != carried:
+			letters = convert(rounds)
+			last[0] = (rounds, letters)
+		return letters + table[703 + rest]
+
+	return convert
+
+#Generate the letters for first, first+inc, ... (n of them, n None meaning without end) from 'table'.  The
+#values are taken a round at a time (see alpha_converter): the last three letters of each value in a round
+#are a slice of the table, and the leading letters are worked out once for the round and put in front.
+def alpha_labels(table, first, inc, n):
+	return chain.from_iterable(alpha_rounds(table, first, inc, n))
+
+#Generate the letters of each round for alpha_labels(), as an iterable for each
+def alpha_rounds(table, first, inc, n):
+	convert = alpha_converter(table)
+	value = first
+
+	while n is None or n > 0:
+		done = max(0, (value - 703) // 17576) #whole rounds before this one
+		base = done * 17576
+
+		#Number of the values left in this round
+		if inc > 0:
+			size = (base + len(table) - value + inc - 1) // inc
+		elif done > 0:
+			size = (value - base - 703) // -inc + 1
+		else:
+			size = (value - 1) // -inc + 1
+		if n is not None:
+			size = min(size, n)
+			n -= size
+
+		stop = value - base + size * inc
+		if stop < 0:
+			stop = None
+		if done > 0:
+			yield imap(convert(done).__add__, table[value - base:stop:inc])
+		else:
+			yield table[value:stop:inc]
+
+		value += size * inc
+
+#Total number of letters of the first, first+inc, ... (n of them) letter sequences, worked out a band of
+#equally long sequences at a time (1..26 have one letter, 27..702 two, and so on)
+def letters_total(first, inc, n):
+	if n <= 0:
+		return 0
+
+	highest = max(first, first + (n-1) * inc)
+	total = 0
+	letters = 1
+	low = 1
+	while low <= highest:
+		high = low * 26 #the last sequence with this many letters
+		total += letters * progression_count(first, inc, n, low, high)
+		letters += 1
+		low = high + 1
+
+	return total
+
+#Join each line of 'lines' to its label from 'labels'.  A label of None leaves the line unnumbered.
+def numbered_lines(labels, sep, lines):
+	for label, line in izip(labels, lines):
+		if label is None:
+			yield line
+		else:
+			yield label + sep + line
+
+#Count the lines in 'stream', reading it in large blocks.  A last line without a newline counts too.
+#Returns the number of lines and the number of bytes read.
+def count_lines(stream):
+	lines = 0
+	size = 0
+	last = '\n'
+
+	while True:
+		block = stream.read(1 << 20)
+		if not block:
+			break
+		lines += block.count('\n')
+		size += len(block)
+		last = block[-1]
+
+	if last != '\n':
+		lines += 1
+	return lines, size
+
+#Prepare 'stream' (standard input by default) for numbering.  Returns an iterator over its lines and the
+#number of lines.
+#Lines are read as they are numbered, so memory use does not depend on the size of the input.
+#
+#The equal-width and pad options need the number of lines (and so the widest number) before the
+#first line is written.  When 'need_count' is set the input is read twice: if it is a regular file
+#it is counted and then rewound, otherwise (a pipe or terminal) it is copied to a temporary file
+#while counting and the lines are read back from there.  Without 'need_count' the count is None.
+def read_numbered_input(need_count, stream=None):
+	import io
+
+	if stream is None:
+		stream = io.open(sys.stdin.fileno(), 'rb', closefd=False)
+
+	if not need_count:
+		return stream, None
+
+	if stat.S_ISREG(os.fstat(stream.fileno()).st_mode):
+		position = stream.tell()
+		lines, size = count_lines(stream)
+		stream.seek(position)
+		return stream, lines
+
+	import tempfile #only needed to spool a pipe
+	spool = tempfile.TemporaryFile()
+	lines = 0
+	last = '\n'
+	while True:
+		block = stream.read(1 << 20)
+		if not block:
+			break
+		spool.write(block)
+		lines += block.count('\n')
+		last = block[-1]
+
+	if last != '\n':
+		lines += 1
+	spool.seek(0)
+	return spool, lines
+
+#Generate the output of numbering 'lines' (the lines of a binary stream, see read_numbered_input) with
+#'sequence', in pieces of about buffer_size bytes.  The lines are passed through byte for byte, whatever
+#their encoding, and are only copied once: the labels for a batch of lines are formatted together and put
+#between the lines with slice assignments, rather than joining a label to each line.  Lines left without a
+#label (past a counting down, or the end of the roman numerals) are written as they are.  The first line is
+#numbered with the element with index 'start'.  With 'stats' the time spent on each phase and the number of
+#lines are added to it.
+def numbered_chunks(sequence, lines, buffer_size=None, stats=None, start=0):
+	if buffer_size is None:
+		buffer_size = output_buffer_size
+
+	k, n, blank = sequence.span(start)
+	values = iter(sequence.values(k, n))
+	lines = iter(lines)
+	sep = sequence.sep
+	batch = 64 #number of lines in the next chunk, adjusted as in render_chunks()
+
+	while True:
+		started = time.time()
+		text_lines = list(islice(lines, batch))
+		read = time.time()
+		if not text_lines:
+			break
+
+		chunk = list(islice(values, len(text_lines)))
+		generated = time.time()
+
+		labelled = len(chunk)
+		pieces = [sep] * (3 * labelled)
+		pieces[0::3] = sequence.format_values(chunk)
+		pieces[2::3] = text_lines[:labelled]
+		pieces.extend(text_lines[labelled:])
+		text = ''.join(pieces)
+
+		if stats is not None:
+			stats.add('read', read - started)
+			stats.add('generate', generated - read)
+			stats.add('format', time.time() - generated)
+			stats.elements += len(text_lines)
+		yield text
+
+		batch = max(1, batch * buffer_size // len(text))
+
+#Number of lines in 'stream', and the number of bytes numbering them with 'sequence' gives.  Every line
+#is written once, with a label and separator in front unless it has run out of labels.
+def numbered_size(sequence, stream):
+	lines, size = count_lines(stream)
+	sequence.set_length(lines)
+	k, n, blank = sequence.span()
+	return lines, size + sequence.text_length(0, n) + n * len(sequence.sep)
+
+#Number of lines in the file 'path' and the number of bytes numbering it with a copy of 'sequence' gives, so
+#the file gets a width of its own, as in numbered_file_chunks
+def numbered_file_size(sequence, path):
+	import copy
+
+	stream = open_numbered_file(path)
+	try:
+		return numbered_size(copy.copy(sequence), stream)
+	finally:
+		stream.close()
+
+#Open one of the files to number, turning a failure into a SequError
+def open_numbered_file(path):
+	import io
+
+	try:
+		return io.open(path, 'rb')
+	except IOError as error:
+		raise SequError(path + ": Error, " + error.strerror)
+
+#Open a file to write output to (with 'mode', 'wb' by default), turning a failure into a SequError
+def open_output(path, mode='wb'):
+	try:
+		return open(path, mode)
+	except IOError as error:
+		raise SequError(path + ": Error, " + error.strerror)
+
+#Generate the chunks of output of numbering the file 'path' with a copy of 'sequence' (a sequence for
+#numbering lines), so every file is numbered from First and padded to its own width
+def numbered_file_chunks(sequence, path, buffer_size=None):
+	import copy
+
+	stream = open_numbered_file(path)
+	try:
+		sequence = copy.copy(sequence)
+		lines, count = read_numbered_input(sequence.needs_length(), stream)
+		sequence.set_length(count)
+		for chunk in numbered_chunks(sequence, lines, buffer_size):
+			yield chunk
+	finally:
+		stream.close()
+
+#Number a file for queued_file_chunks, in a thread of its own.  The chunks are put on 'queue', followed by
+#None when the file is done or by the error that stopped it.  Once 'stopped' is set the file is closed and
+#no more are worked out.
+def queue_numbered_file(queue, sequence, path, buffer_size, stopped):
+	try:
+		chunks = numbered_file_chunks(sequence, path, buffer_size)
+		for chunk in chunks:
+			queue.put(chunk)
+			if stopped.is_set():
+				chunks.close()
+				return
+		queue.put(None)
+	except Exception as error:
+		queue.put(error)
+
+#Generate the output of numbering each of the files in 'paths' with 'sequence', one file after another in
+#order.  'jobs' files are read and numbered by threads at the same time, each putting its output on a
+#queue of at most file_queue_depth chunks; while one file's output is written the next ones are being read.
+#With 'stats' the time spent waiting for the threads is added to it.  If the output stops early (the output
+#has gone away, or a file could not be read) the threads still running are stopped and waited for, as in
+#pipelined_chunks, so none is left holding its file open.
+def queued_file_chunks(sequence, paths, jobs=None, buffer_size=None, stats=None):
+	import threading
+	import Queue
+	import collections
+
+	if jobs is None:
+		jobs = file_jobs
+
+	paths = iter(paths)
+	pending = collections.deque()
+	stopped = threading.Event()
+
+	#Start numbering the next file, if there is one
+	def start():
+		for path in islice(paths, 1):
+			queue = Queue.Queue(file_queue_depth)
+			thread = threading.Thread(target=queue_numbered_file, args=(queue, sequence, path, buffer_size, stopped))
+			thread.daemon = True
+			thread.start()
+			pending.append((queue, thread))
+
+	for i in range(jobs):
+		start()
+
+	try:
+		while pending:
+			queue, thread = pending[0]
+			while True:
+				#A timeout keeps the wait interruptible with Ctrl-C under python 2
+				if stats is None:
+					chunk = queue.get(True, 86400)
+				else:
+					started = time.time()
+					chunk = queue.get(True, 86400)
+					stats.add('workers', time.time() - started)
+
+				if chunk is None:
+					break
+				elif isinstance(chunk, Exception):
+					raise chunk
+				yield chunk
+
+			pending.popleft()
+			start()
+	finally:
+		#Make room for the chunk each thread may be waiting to put, so it sees it has been stopped
+		stopped.set()
+		for queue, thread in pending:
+			while not queue.empty():
+				queue.get_nowait()
+		for queue, thread in pending:
+			thread.join(86400)
+
+#Refuse to write numbered output to the file 'output' if it is one of the files in 'paths' or the file open as
+#'stream', since opening it for writing would empty it before it is read
+def check_output_not_input(output, paths=(), stream=None):
+	try:
+		written = os.stat(output)
+	except OSError:
+		return #not there yet, so not an input
+
+	inputs = []
+	for path in paths:
+		try:
+			inputs.append(os.stat(path))
+		except OSError:
+			pass #reported when it is opened
+	if stream is not None:
+		try:
+			inputs.append(os.fstat(stream.fileno()))
+		except (AttributeError, IOError, OSError, ValueError):
+			pass
+
+	for info in inputs:
+		if os.path.samestat(written, info):
+			raise SequError(output + ": Error, the output is the input being numbered")
+
+#Number the file 'path' with 'sequence' into the file named path + suffix
+def number_file_to(sequence, suffix, buffer_size, path):
+	check_output_not_input(path + suffix, [path])
+	out = open_output(path + suffix)
+	try:
+		write_chunks(numbered_file_chunks(sequence, path, buffer_size), out)
+	finally:
+		out.close()
+
+#Number each of the files in 'paths' with 'sequence', each from First, into a file named after it plus
+#'suffix'.  'jobs' threads number files at the same time.
+def number_files_to(sequence, paths, suffix, jobs=None, buffer_size=None, stats=None):
+	from multiprocessing.pool import ThreadPool
+
+	if jobs is None:
+		jobs = file_jobs
+
+	started = time.time()
+	pool = ThreadPool(min(jobs, len(paths)))
+	try:
+		pool.map(partial(number_file_to, sequence, suffix, buffer_size), paths, 1)
+	finally:
+		pool.terminate()
+
+	if stats is not None:
+		stats.add('workers', time.time() - started)
+		stats.bytes += sum(os.path.getsize(path + suffix) for path in paths)
+
+#Return the bytes from start up to stop of the file open as 'fd', read through a memory map of just that part
+def read_region(fd, start, stop):
+	import mmap
+
+	aligned = start - start % mmap.ALLOCATIONGRANULARITY
+	mapped = mmap.mmap(fd, stop - aligned, access=mmap.ACCESS_READ, offset=aligned)
+	try:
+		return mapped[start - aligned:stop - aligned]
+	finally:
+		mapped.close()
+
+#Count the newlines in one region of the input for parallel_numbered_chunks, in a worker process
+def count_region(region):
+	fd, start, stop = region[:3]
+	return read_region(fd, start, stop).count('\n')
+
+#Number the lines of one region of the input for parallel_numbered_chunks, in a worker process.  The first
+#line is numbered with the element with index 'line', and 'lines' is the number of lines in the whole input,
+#which the worker's sequence is given the first time (to work out the width).
+def number_region(region):
+	fd, start, stop, line, lines = region
+
+	if worker_sequence.length != lines:
+		worker_sequence.set_length(lines)
+
+	import io
+	data = io.BytesIO(read_region(fd, start, stop))
+	return ''.join(numbered_chunks(worker_sequence, data, stop - start + 1, None, line))
+
+#Split the regular file open as 'stream' (from its current position) into regions of about block_size
+#bytes, each ending just after a newline (except the last, at the end of the file).  Only the bytes around
+#each boundary are looked at, through a memory map.  Returns (start, stop) pairs.
+def split_lines_regions(stream, block_size):
+	import mmap
+
+	position = stream.tell()
+	size = os.fstat(stream.fileno()).st_size
+	if position >= size:
+		return []
+
+	mapped = mmap.mmap(stream.fileno(), size, access=mmap.ACCESS_READ)
+	try:
+		regions = []
+		start = position
+		while start < size:
+			stop = mapped.find('\n', min(start + block_size, size) - 1) + 1
+			if stop == 0:
+				stop = size
+			regions.append((start, stop))
+			start = stop
+	finally:
+		mapped.close()
+
+	return regions
+
+#Generate the output of numbering the lines of 'stream', a regular file (standard input redirected from one,
+#say), with 'sequence', like numbered_chunks but in 'jobs' worker processes.  The file is split at newlines
+#into regions of about block_size bytes (parallel_block_size by default), and the workers first count the
+#newlines in each region, which gives the index of the first line of each and the number of lines (for the
+#width).  Then the workers number the regions, each read through a memory map, and the text comes back in
+#order, at most two regions per worker in flight as in parallel_chunks.  With 'stats' the time spent waiting
+#for the workers and the number of lines are added to it.
+def parallel_numbered_chunks(sequence, stream, jobs, block_size=None, stats=None):
+	import multiprocessing #slow to import, and only needed here
+	import collections
+
+	if block_size is None:
+		block_size = parallel_block_size
+
+	fd = stream.fileno()
+	regions = [(fd, start, stop) for start, stop in split_lines_regions(stream, block_size)]
+	if not regions:
+		return
+
+	pool = multiprocessing.Pool(jobs, init_worker, (sequence,))
+	pending = collections.deque()
+
+	try:
+		started = time.time()
+		counts = pool.map(count_region, regions, 1)
+		lines = sum(counts)
+		if read_region(fd, regions[-1][2] - 1, regions[-1][2]) != '\n':
+			lines += 1 #a last line without a newline
+		sequence.set_length(lines)
+		if stats is not None:
+			stats.add('workers', time.time() - started)
+
+		line = 0
+		for region, lines_in_region in izip(regions, counts):
+			task = region + (line, lines)
+			pending.append(((line, line + lines_in_region), pool.apply_async(number_region, (task,))))
+			line += lines_in_region
+			if len(pending) >= 2 * jobs:
+				yield collect_block(pending.popleft(), stats)
+
+		while pending:
+			yield collect_block(pending.popleft(), stats)
+	finally:
+		#As in parallel_chunks, let the regions in flight finish before stopping the workers
+		for block, result in pending:
+			result.wait(86400)
+		pool.terminate()
+
+	if stats is not None and lines > line:
+		stats.elements += lines - line
+
+#Find the argument with the most decimal places, use that to format floating-point numbers when no
+#format option is present.
+#http://stackoverflow.com/questions/6189956/easy-way-of-finding-decimal-places
+def highest_precision(*arg):
+	most = 0
+	temp = 0
+
+	for i in range(0, len(arg)):
+		temp = decimal_parts(arg[i])[2]
+		if temp < most:
+			most = temp
+
+	return abs(most)
+
+#Pad 'arg' to the left with 'pad_str' (a single character, or nothing) to be length of 'size'
+def char_pad(arg, pad_str, size):
+	return pad_str * max(0, min(size - 1, size - len(arg))) + arg
+
+#Work out the format word from an argument, the way the command line does when there is no -F option.  A
+#single letter is a character; longer words made only of roman numeral letters are roman numerals.
+def infer_format_word(arg):
+	if is_int(arg):
+		return "arabic"
+	elif is_float(arg):
+		return "floating"
+	elif is_lower_char(arg):
+		return "alpha"
+	elif is_upper_char(arg):
+		return "ALPHA"
+	elif is_lower_roman(arg):
+		return "roman"
+	elif is_upper_roman(arg):
+		return "ROMAN"
+	elif is_lower_alpha(arg):
+		return "alpha"
+	elif is_upper_alpha(arg):
+		return "ALPHA"
+	else:
+		raise SequError(arg + ": Error, could not infer format word")
+
+#Turn an argument given to the library into the string the command line would have seen
+def arg_string(arg):
+	if isinstance(arg, float):
+		return repr(arg)
+	return str(arg)
+
+##################################################################################
+
+#A sequence, described by the same arguments as the command line: First, Last and Increment (strings,
+#or numbers which are converted to strings) and the options.  The arguments are checked, and the format
+#word worked out, when the sequence is created; anything the command line would refuse raises SequError.
+#
+#Iterating over a sequence gives its elements as strings, without separators.  chunks() gives the exact
+#output of the command line in large pieces.  'length' is the number of elements.
+#
+#With 'numbered' set the sequence is used to number lines: 'last' is then the number of lines, which
+#is only needed (and may be None) without the equal-width and pad options.  See number().
+class Sequence(object):
+	def __init__(self, first, last, increment=None, format_word=None, form=None, sep='\n', equal_width=False,
+			pad=None, numbered=False):
+		first = arg_string(first)
+		if not numbered:
+			last = arg_string(last)
+		if increment is not None:
+			increment = arg_string(increment)
+
+		#No format word given, infer it from the last argument (or the first, when numbering lines)
+		if format_word is None and numbered:
+			format_word = infer_format_word(first)
+		elif format_word is None:
+			format_word = infer_format_word(last)
+		elif format_word not in ['arabic', 'floating', 'alpha', 'ALPHA', 'roman', 'ROMAN']:
+			raise SequError(str(format_word) + ": Invalid format word.")
+
+		if pad is not None and len(pad) > 1:
+			raise SequError(str(pad) + ": Invalid pad, must be single character.")
+
+		self.format_word = format_word
+		self.sep = sep
+		self.numbered = numbered
+		self.equal_width = equal_width
+		self.padded = pad is not None and not equal_width
+		self.pad = ' ' #pad string
+		self.width = 0 #width to pad elements to
+		self.domain = None #number of elements before running out of letters (counting down) or roman numerals
+
+		if self.padded:
+			self.pad = pad
+
+		#Make sure the increment is appropriate for the format word.
+		if format_word in ["arabic", "alpha", "ALPHA"]:
+			if increment is None:
+				increment = "1"
+			if is_int(increment):
+				if int(increment) == 0:
+					raise SequError("Error: Invalid increment, cannot be zero.")
+			else:
+				raise SequError("Error: Increment must be an integer.")
+
+		if format_word == "floating":
+			if increment is None:
+				increment = "1"
+			if is_float(increment):
+				if float(increment) == 0:
+					raise SequError("Error: Invalid increment, cannot be zero.")
+			else:
+				raise SequError("Error: Increment must be a floating point number.")
+
+		if format_word == "roman":
+			if increment is None:
+				increment = "i"
+			if is_lower_roman(increment):
+				roman_to_int(increment)
+			else:
+				raise SequError("Error: Increment must be a roman numeral")
+
+		if format_word == "ROMAN":
+			if increment is None:
+				increment = "I"
+			if is_upper_roman(increment):
+				roman_to_int(increment)
+			else:
+				raise SequError("Error: Increment must be an upper case roman numeral.")
+
+		#Check that the arguments are of the right type, and convert them
+		if format_word == "arabic":
+			if not (is_int(first) and (numbered or is_int(last))):
+				raise SequError("Error: mixed types, both start and end must be integers")
+
+			self.start = int(first)
+			self.inc = int(increment)
+			if not numbered:
+				self.length = range_length(self.start, int(last), self.inc)
+
+				#Figure out how wide to set each string to if equal width is an option
+				if len(str(self.start)) > len(str(int(last))):
+					self.width = len(str(self.start))
+				else:
+					self.width = len(str(int(last)))
+
+		elif format_word == "floating":
+			if not (is_float(first) and (numbered or is_float(last))):
+				raise SequError("Error: mixed types, both start and end must be floats")
+
+			#Find number of decimal places needed to represent all numbers well
+			if numbered:
+				self.prec = highest_precision(first, increment)
+			else:
+				self.prec = highest_precision(first, last, increment)
+
+			#No format option, build format string
+			if form is None:
+				form = "%." + str(self.prec) + "f"
+			self.form = form
+
+			self.start = scale_decimal(first, self.prec)
+			self.inc = scale_decimal(increment, self.prec)
+
+			#Figure out how wide to set each string if equal width is an option.  This also checks the
+			#format string, once, so it can be used on the elements without checking again.
+			try:
+				self.width = len(str(form % float(first)))
+				if not numbered and len(str(form % float(last))) > self.width:
+					self.width = len(str(form % float(last)))
+			except Exception:
+				raise SequError(str(form) + ": Invalid format.")
+
+			if not numbered:
+				self.length = range_length(self.start, scale_decimal(last, self.prec), self.inc)
+
+		elif format_word in ["alpha", "ALPHA"]:
+			if format_word == "alpha":
+				check, kind = is_lower_alpha, "lower case characters"
+			else:
+				check, kind = is_upper_alpha, "upper case characters"
+			if not (check(first) and (numbered or check(last))):
+				raise SequError("Error: mixed types, both start and end must be " + kind)
+
+			#Letters go on from z to aa, ab, ... without end, but stop at a counting down
+			self.start = alpha_to_int(first)
+			self.inc = int(increment)
+			if self.inc < 0:
+				self.domain = (self.start - 1) // -self.inc + 1
+			if not numbered:
+				self.length = range_length(self.start, alpha_to_int(last), self.inc)
+
+		else:
+			if format_word == "roman":
+				check, kind = is_lower_roman, "lower case roman numerals"
+			else:
+				check, kind = is_upper_roman, "upper case roman numerals"
+			if not (check(first) and (numbered or check(last))):
+				raise SequError("Error: mixed types, both start and end must be " + kind)
+
+			self.start = roman_to_int(first)
+			self.inc = roman_to_int(increment)
+			self.domain = (3999 - self.start) // self.inc + 1
+			if not numbered:
+				self.length = range_length(self.start, roman_to_int(last), self.inc)
+				self.width = roman_width(self.start, roman_to_int(last), self.inc)
+
+			#The pad string is lower cased along with the numerals
+			if format_word == "roman":
+				self.pad = self.pad.lower()
+
+		if numbered:
+			self.set_length(last)
+		else:
+			self.plan_format()
+
+		#A newline ends the output, unless the separator already did.  Empty character sequences print nothing at all.
+		if sep == '\n' or (format_word in ["alpha", "ALPHA"] and self.length == 0):
+			self.trailer = ''
+		else:
+			self.trailer = '\n'
+
+	#Does numbering lines with this sequence need the number of lines up front?
+	def needs_length(self):
+		return self.numbered and (self.equal_width or self.padded) and self.format_word not in ["alpha", "ALPHA"]
+
+	#Set the number of lines to be numbered (None if not known), and work out the width they need
+	def set_length(self, length):
+		self.length = length
+
+		if length is not None and length > 0:
+			#The widest label is the first or the last one
+			last = self.start + (length-1) * self.inc
+
+			if self.format_word == "arabic":
+				if len(str(last)) > len(str(self.start)):
+					self.width = len(str(last))
+				else:
+					self.width = len(str(self.start))
+
+			elif self.format_word == "floating":
+				first = list(float_sequence(self.start, self.inc, 1, self.prec))[0]
+				last = list(float_sequence(last, self.inc, 1, self.prec))[0]
+				self.width = max(len(self.form % first), len(self.form % last))
+
+			elif self.format_word in ["roman", "ROMAN"]:
+				self.width = roman_width(self.start, last, self.inc)
+
+		self.plan_format()
+
+	#Work out, once the options and width are known, how element values are turned into strings: one
+	#conversion (str, the format string, a letter or roman numeral table) and at most one padding method.
+	#The roman numeral tables are padded up front, so numerals are only looked up.  Sets 'formatter',
+	#which maps an iterable of values to their strings without looking at the options again.
+	def plan_format(self):
+		if self.equal_width and self.format_word in ["roman", "ROMAN"]:
+			pad = methodcaller('rjust', self.width)
+		elif self.equal_width:
+			pad = methodcaller('zfill', self.width)
+		elif self.padded and self.pad:
+			pad = methodcaller('rjust', self.width, self.pad)
+		else:
+			pad = None
+
+		if self.format_word == "arabic":
+			convert = str
+		elif self.format_word == "floating":
+			convert = self.form.__mod__
+		elif self.format_word in ["alpha", "ALPHA"]:
+			if self.format_word == "ALPHA":
+				table = alpha_tables()[0]
+			else:
+				table = alpha_tables()[1]
+			self.letters = table
+
+			#The letters are looked up directly if none of them is longer than three
+			if self.inc < 0:
+				highest = self.start
+			elif self.length is not None:
+				highest = self.start + max(0, self.length - 1) * self.inc
+			else:
+				highest = None
+			if highest is not None and highest < len(table):
+				convert = table.__getitem__
+			else:
+				convert = alpha_converter(table)
+			pad = None #characters are never padded
+		else:
+			if self.format_word == "ROMAN":
+				table = roman_tables()[0]
+			else:
+				table = roman_tables()[1]
+			if pad is not None:
+				table = map(pad, table)
+				pad = None
+			convert = table.__getitem__
+
+		if pad is None:
+			self.formatter = partial(imap, convert)
+		else:
+			self.formatter = lambda values: imap(pad, imap(convert, values))
+
+	#Iterate over the elements.  When numbering lines, the elements past a (counting down) or the end of
+	#the roman numerals are None, meaning the line is left unnumbered.
+	def __iter__(self):
+		return self.elements()
+
+	#Iterate over the elements with index start up to (but not including) stop, stop None meaning the end
+	#of the sequence.  Each one is computed directly from its index, and padded to the width of the
+	#whole sequence, so a part of a sequence prints exactly as it would in the full run.
+	def elements(self, start=0, stop=None):
+		k, n, blank = self.span(start, stop)
+
+		labels = self.render(k, n)
+		if blank is None:
+			return chain(labels, repeat(None))
+		elif blank:
+			return chain(labels, repeat(None, blank))
+		return iter(labels)
+
+	#Work out what elements(start, stop) gives: returns the index of the first element, the number of
+	#elements to render from there and the number of Nones after them (both None meaning without end)
+	def span(self, start=0, stop=None):
+		if self.needs_length() and self.length is None:
+			raise SequError("Error: the number of lines is needed for the equal-width and pad options")
+
+		if self.length is not None:
+			if stop is None or stop > self.length:
+				stop = self.length
+			if start > stop:
+				start = stop
+
+		if stop is None:
+			n = None
+		else:
+			n = stop - start
+
+		if self.domain is not None and (n is None or start + n > self.domain):
+			rendered = max(0, self.domain - start)
+			if n is None:
+				return start, rendered, None
+			return start, rendered, n - rendered
+
+		return start, n, 0
+
+	#Return the element with index k
+	def element(self, k):
+		if k < 0 or (self.length is not None and k >= self.length):
+			raise IndexError("sequence index out of range")
+
+		return self.elements(k, k+1).next()
+
+	#Generate n elements (n None means without end) as strings, beginning with the one with index k.
+	#Letters are worked out a round at a time rather than from each value (see alpha_labels).
+	def render(self, k, n):
+		if self.format_word in ["alpha", "ALPHA"]:
+			return alpha_labels(self.letters, self.start + k * self.inc, self.inc, n)
+		return self.format_values(self.values(k, n))
+
+	#Generate the values of n elements (n None means without end), beginning with the one with index k.
+	#They are integers (character codes and the values of roman numerals too), or floats for floating.
+	def values(self, k, n):
+		first = self.start + k * self.inc
+
+		if self.format_word == "floating":
+			return float_sequence(first, self.inc, n, self.prec)
+		elif n is None:
+			return count(first, self.inc)
+		return int_range(first, first + n * self.inc, self.inc)
+
+	#Format each of the element values from values() as a string (see plan_format)
+	def format_values(self, values):
+		return self.formatter(values)
+
+	#Generate the output of the sequence, exactly as the command line prints it, in pieces of
+	#about buffer_size bytes.  start and stop select part of the sequence, as for elements().  With
+	#'stats' (a Stats) the time spent generating and formatting the elements is added to it.
+	def chunks(self, buffer_size=None, start=0, stop=None, stats=None):
+		body = self.body_chunks(buffer_size, start, stop, stats)
+		if self.trailer:
+			return chain(body, [self.trailer])
+		return body
+
+	#Number of bytes every element takes in the output, separator included, if they all take the same,
+	#otherwise None.  That is the case with the equal-width and pad options for arabic and roman numerals
+	#and for floating with the default format, where no element can be wider than the first or last.
+	def element_size(self):
+		if not (self.equal_width or (self.padded and self.pad)):
+			return None
+		if self.format_word in ["alpha", "ALPHA"]:
+			return None
+		if self.format_word == "floating" and self.form != "%." + str(self.prec) + "f":
+			return None
+		return self.width + len(self.sep)
+
+	#Number of bytes chunks(None, start, stop) gives, worked out without formatting the elements
+	def output_bytes(self, start=0, stop=None):
+		k, n, blank = self.span(start, stop)
+		return self.text_length(k, n) + n * len(self.sep) + len(self.trailer)
+
+	#Total length of the n elements from index k, without separators.  It is worked out from the first
+	#element, the increment and the width, except with the format option, where the elements are
+	#formatted (but not written) to measure them.
+	def text_length(self, k, n):
+		first = self.start + k * self.inc
+
+		if self.element_size() is not None:
+			return n * self.width
+		elif self.format_word == "arabic":
+			return digits_total(first, self.inc, n)
+		elif self.format_word == "floating" and self.form == "%." + str(self.prec) + "f":
+			if self.prec > 0:
+				return digits_total(first, self.inc, n, self.prec + 1) + n #the decimal points
+			return digits_total(first, self.inc, n)
+		elif self.format_word in ["alpha", "ALPHA"]:
+			return letters_total(first, self.inc, n)
+		elif self.format_word in ["roman", "ROMAN"]:
+			return sum(roman_tables()[2][first:first + n * self.inc:self.inc])
+		return sum(imap(len, self.render(k, n)))
+
+	#Like chunks(), without the trailer.  Long arabic and floating sequences are formatted by numpy
+	#when it is installed (see numpy_chunks), everything else one element at a time.
+	def body_chunks(self, buffer_size=None, start=0, stop=None, stats=None):
+		np = numpy_engine(self, start, stop)
+		if np is not None:
+			return numpy_chunks(np, self, start, stop, buffer_size, stats)
+		elif stats is not None:
+			return timed_chunks(self, stats, start, stop, buffer_size)
+		return render_chunks(self.elements(start, stop), self.sep, buffer_size)
+
+	#Generate each line of 'lines' (strings that keep their line endings) with its number in front
+	def number(self, lines):
+		return numbered_lines(self, self.sep, lines)
+
+#Like the sequence's body_chunks() method, but adding the time spent on each phase and the number of
+#elements to 'stats'.  Each batch of values is worked out before any of it is formatted, so the two can be
+#timed apart.
+def timed_chunks(sequence, stats, start=0, stop=None, buffer_size=None):
+	if buffer_size is None:
+		buffer_size = output_buffer_size
+
+	k, left, blank = sequence.span(start, stop)
+	values = iter(sequence.values(k, left))
+	if blank is None:
+		values = chain(values, repeat(None))
+	elif blank:
+		values = chain(values, repeat(None, blank))
+
+	batch = 64 #number of elements in the next chunk, adjusted as in render_chunks()
+
+	while True:
+		started = time.time()
+		chunk = list(islice(values, batch))
+		generated = time.time()
+		stats.add('generate', generated - started)
+		if not chunk:
+			break
+
+		#Only the first 'rendered' values are inside the domain, the rest are None
+		rendered = len(chunk)
+		if left is not None:
+			rendered = min(rendered, left)
+			left -= rendered
+		labels = list(sequence.format_values(chunk[:rendered])) + chunk[rendered:]
+		text = sequence.sep.join(labels) + sequence.sep
+		stats.add('format', time.time() - generated)
+		stats.elements += len(chunk)
+		yield text
+
+		if len(text) > 0:
+			batch = max(1, batch * buffer_size // len(text))
+		else:
+			batch = batch * 2
+
+#Import numpy the first time it is asked for.  Returns None if it is not installed.
+def load_numpy():
+	global numpy_cache
+
+	if numpy_cache is False:
+		try:
+			import numpy
+			numpy_cache = numpy
+		except ImportError:
+			numpy_cache = None
+
+	return numpy_cache
+
+#Return the numpy module if the elements from start up to stop (None for the end) of 'sequence' can be
+#formatted with numpy_block, otherwise None.  That takes an arabic sequence whose values fit in 64 bit
+#integers, or a floating one printed with the default format whose values have at most 15 digits, so
+#that they print exactly as their scaled integers read with a decimal point.
+def numpy_engine(sequence, start=0, stop=None):
+	if sequence.numbered or not isinstance(sequence.sep, str):
+		return None
+	if sequence.format_word == "arabic":
+		limit = 2**62
+	elif sequence.format_word == "floating" and sequence.form == "%." + str(sequence.prec) + "f":
+		limit = 10**15
+	else:
+		return None
+
+	k, n, blank = sequence.span(start, stop)
+	if n < numpy_min_elements:
+		return None
+	if max(abs(sequence.start + k * sequence.inc), abs(sequence.start + (k + n - 1) * sequence.inc)) >= limit:
+		return None
+
+	return load_numpy()
+
+#Format the elements from index start up to stop of 'sequence' with numpy, each followed by the separator.
+#The characters of all the elements are built column by column, right to left, in one array of bytes:
+#the digits (with the decimal point for floating), then the sign and padding.  The columns left of
+#each element's own width are masked out, and what is left is read off row by row.  numpy_engine
+#says which sequences this can be used for.
+def numpy_block(np, sequence, start, stop):
+	values = np.arange(start, stop, dtype=np.int64) * sequence.inc + sequence.start
+	return numpy_format(np, sequence, values)
+
+#Format the scaled integer 'values' of elements of 'sequence' for numpy_block
+def numpy_format(np, sequence, values):
+	negative = values < 0
+	remainder = np.abs(values)
+
+	#Number of digits, and then the number of characters without the sign
+	powers = 10 ** np.arange(1, 19, dtype=np.int64)
+	digits = np.searchsorted(powers, remainder, side='right') + 1
+	point = 0
+	if sequence.format_word == "floating":
+		point = sequence.prec
+	if point:
+		body = np.maximum(digits, point + 1) + 1
+	else:
+		body = digits
+
+	#Number of characters of each element once it is padded
+	width = body + negative
+	if sequence.equal_width or (sequence.padded and sequence.pad):
+		width = np.maximum(width, sequence.width)
+	columns = int(width.max())
+
+	sep = bytearray(sequence.sep)
+	out = np.empty((len(values), columns + len(sep)), dtype=np.uint8)
+	out[:, columns:] = sep
+
+	#Character of the columns left of the digits, and where the sign goes
+	if sequence.equal_width:
+		fill = ord('0')
+		sign = width - 1
+	elif sequence.padded and sequence.pad:
+		fill = ord(sequence.pad)
+		sign = body
+	else:
+		fill = ord(' ')
+		sign = body
+	any_negative = negative.any()
+	shortest = int(body.min())
+
+	for column in range(columns - 1, -1, -1):
+		r = columns - 1 - column #position counting from the right
+
+		if point and r == point:
+			char = ord('.')
+		else:
+			remainder, char = np.divmod(remainder, 10)
+			char += ord('0')
+
+		if r < shortest:
+			out[:, column] = char
+		elif any_negative:
+			out[:, column] = np.where(body > r, char, np.where(negative & (sign == r), ord('-'), fill))
+		else:
+			out[:, column] = np.where(body > r, char, fill)
+
+	#Leave out the columns left of each element, unless they are all the same width
+	if int(width.min()) == columns:
+		return out.tostring()
+	keep = np.ones(out.shape, dtype=bool)
+	keep[:, :columns] = np.arange(columns - 1, -1, -1) < width[:, np.newaxis]
+	return out[keep].tostring()
+
+#Generate the elements from start up to stop (None for the end) of 'sequence', each followed by the
+#separator, in pieces of about buffer_size bytes formatted by numpy_block.  With 'stats' the time spent
+#is added to it.  See numpy_engine.
+def numpy_chunks(np, sequence, start=0, stop=None, buffer_size=None, stats=None):
+	if buffer_size is None:
+		buffer_size = output_buffer_size
+
+	k, n, blank = sequence.span(start, stop)
+
+	for first, last in split_blocks(sequence, k, k + n, buffer_size):
+		if stats is None:
+			yield numpy_block(np, sequence, first, last)
+			continue
+
+		started = time.time()
+		values = np.arange(first, last, dtype=np.int64) * sequence.inc + sequence.start
+		generated = time.time()
+		text = numpy_format(np, sequence, values)
+		stats.add('generate', generated - started)
+		stats.add('format', time.time() - generated)
+		stats.elements += last - first
+		yield text
+
+#The sequence a worker process of parallel_chunks formats blocks of
+worker_sequence = None
+
+#Set up a worker process of parallel_chunks
+def init_worker(sequence):
+	global worker_sequence
+	worker_sequence = sequence
+
+#Format the elements from index start up to stop of the worker's sequence, each followed by the separator
+def render_block(block):
+	start, stop = block
+	np = numpy_engine(worker_sequence, start, stop)
+	if np is not None:
+		return numpy_block(np, worker_sequence, start, stop)
+
+	sep = worker_sequence.sep
+	return sep.join(worker_sequence.elements(start, stop)) + sep
+
+#Wait for a block handed to a worker by parallel_chunks and return its text, adding the time waited and
+#the number of elements to 'stats' if given
+def collect_block(pending, stats):
+	(start, stop), result = pending
+
+	#A timeout keeps the wait interruptible with Ctrl-C under python 2
+	if stats is None:
+		return result.get(86400)
+
+	started = time.time()
+	text = result.get(86400)
+	stats.add('workers', time.time() - started)
+	stats.elements += stop - start
+	return text
+
+#Split the elements from start up to stop of 'sequence' into contiguous blocks of about block_size
+#bytes of output.  Returns (start, stop) pairs.
+def split_blocks(sequence, start, stop, block_size):
+	if start >= stop:
+		return []
+
+	widest = max(len(sequence.element(start)), len(sequence.element(stop-1))) + len(sequence.sep)
+	step = max(1, block_size // widest)
+	return ((i, min(i + step, stop)) for i in int_range(start, stop, step))
+
+#Generate the output of the elements from start up to stop (None for the end) of 'sequence', like its
+#chunks() method, but formatted by 'jobs' worker processes.  The elements are split into contiguous
+#blocks which are handed out to the workers in turn.  At most two blocks per worker are in flight, and
+#they are yielded in order, so the output is the same as a serial run.  With 'stats' the time spent
+#waiting for the workers is added to it.
+def parallel_chunks(sequence, jobs, start=0, stop=None, block_size=None, stats=None):
+	import multiprocessing #slow to import, and only needed here
+	import collections
+
+	if block_size is None:
+		block_size = parallel_block_size
+	if stop is None or stop > sequence.length:
+		stop = sequence.length
+
+	pending = collections.deque()
+	pool = multiprocessing.Pool(jobs, init_worker, (sequence,))
+
+	try:
+		for block in split_blocks(sequence, start, stop, block_size):
+			pending.append((block, pool.apply_async(render_block, (block,))))
+			if len(pending) >= 2 * jobs:
+				yield collect_block(pending.popleft(), stats)
+
+		while pending:
+			yield collect_block(pending.popleft(), stats)
+	finally:
+		#If the output stops early, let the blocks in flight finish first.  A worker killed while it hands a
+		#block back keeps hold of a lock the pool needs to shut down.
+		for block, result in pending:
+			result.wait(86400)
+		pool.terminate()
+
+	if sequence.trailer:
+		yield sequence.trailer
+
+#Write one shard file for write_shards: the elements from start up to stop of the worker's sequence,
+#followed by the trailer if this is the last shard
+def write_shard(shard):
+	path, start, stop, last = shard
+
+	out = open_output(path)
+	try:
+		write_chunks(worker_sequence.body_chunks(None, start, stop), out)
+		if last:
+			out.write(worker_sequence.trailer)
+	finally:
+		out.close()
+
+	return path
+
+#Write the elements from start up to stop (None for the end) of 'sequence' into files of lines_per_shard
+#elements each, named prefix00, prefix01, ...  Each shard is formatted from its own index range, and
+#'jobs' worker processes (one per CPU by default) write them at the same time.  Concatenated in order
+#the files hold exactly what the command line prints.  Returns the list of file names.  With 'stats' the
+#time spent waiting for the workers, and the elements and bytes they wrote, are added to it.
+def write_shards(sequence, lines_per_shard, prefix, jobs=None, start=0, stop=None, stats=None):
+	import multiprocessing #slow to import, and only needed here
+
+	if jobs is None:
+		jobs = multiprocessing.cpu_count()
+	if stop is None or stop > sequence.length:
+		stop = sequence.length
+	if start > stop:
+		start = stop
+
+	count = max(1, (stop - start + lines_per_shard - 1) // lines_per_shard)
+	digits = max(2, len(str(count - 1)))
+
+	shards = []
+	for k in range(count):
+		first = start + k * lines_per_shard
+		shards.append((prefix + str(k).zfill(digits), first, min(first + lines_per_shard, stop), k == count - 1))
+
+	started = time.time()
+	pool = multiprocessing.Pool(min(jobs, count), init_worker, (sequence,))
+	try:
+		paths = pool.map(write_shard, shards, 1)
+	finally:
+		pool.terminate()
+
+	if stats is not None:
+		stats.add('workers', time.time() - started)
+		stats.elements += stop - start
+		stats.bytes += sum(os.path.getsize(path) for path in paths)
+	return paths
+
+#Format the elements from first up to last of 'sequence' straight into the file 'path', which already
+#has its full size.  Every element takes 'size' bytes and the element with index 'base' is at the start
+#of the file.  Only the part of the file being filled is mapped.
+def fill_mapped(sequence, path, base, first, last, size, stats=None):
+	import mmap
+
+	offset = (first - base) * size
+	aligned = offset - offset % mmap.ALLOCATIONGRANULARITY
+	end = (last - base) * size
+
+	out = open(path, 'r+b')
+	try:
+		mapped = mmap.mmap(out.fileno(), end - aligned, access=mmap.ACCESS_WRITE, offset=aligned)
+	finally:
+		out.close()
+
+	position = offset - aligned
+	try:
+		for chunk in sequence.body_chunks(None, first, last, stats):
+			if stats is not None:
+				started = time.time()
+			mapped[position:position + len(chunk)] = chunk
+			position += len(chunk)
+			if stats is not None:
+				stats.add('write', time.time() - started)
+				stats.bytes += len(chunk)
+	finally:
+		mapped.close()
+
+	if position != end - aligned:
+		raise SequError("Error: elements are not all the same width")
+
+#Fill one region of the output file for write_output, in a worker process
+def fill_region(region):
+	path, base, first, last, size = region
+	fill_mapped(worker_sequence, path, base, first, last, size)
+
+#Write the elements from start up to stop (None for the end) of 'sequence' to the file 'path', exactly as
+#the command line prints them.  When every element takes the same number of bytes (see element_size) the
+#size of the output is known, so the file is made that size up front and memory mapped, and the elements
+#are formatted straight into it.  With more than one job, worker processes fill separate regions of the
+#file at the same time.  Otherwise the output is written to the file as a stream, compressed with 'compress'
+#('gzip' or 'xz') if it is given (see compressed_chunks).
+def write_output(sequence, path, jobs=1, start=0, stop=None, stats=None, buffer_size=None, compress=None):
+	size = sequence.element_size()
+
+	if size is None or compress is not None:
+		if jobs > 1:
+			chunks = parallel_chunks(sequence, jobs, start, stop, None, stats)
+		else:
+			chunks = sequence.chunks(buffer_size, start, stop, stats)
+		if compress is not None:
+			chunks = compressed_chunks(chunks, compress, stats=stats)
+
+		out = open_output(path)
+		try:
+			write_chunks(chunks, out, stats)
+		finally:
+			out.close()
+		return
+
+	k, n, blank = sequence.span(start, stop)
+
+	out = open_output(path)
+	try:
+		out.truncate(n * size)
+		out.seek(n * size)
+		out.write(sequence.trailer)
+	finally:
+		out.close()
+
+	if n == 0:
+		return
+	if jobs == 1:
+		fill_mapped(sequence, path, k, k, k + n, size, stats)
+		return
+
+	import multiprocessing #slow to import, and only needed here
+
+	step = max(1, parallel_block_size // size)
+	regions = [(path, k, i, min(i + step, k + n), size) for i in int_range(k, k + n, step)]
+
+	started = time.time()
+	pool = multiprocessing.Pool(min(jobs, len(regions)), init_worker, (sequence,))
+	try:
+		pool.map(fill_region, regions, 1)
+	finally:
+		pool.terminate()
+
+	if stats is not None:
+		stats.add('workers', time.time() - started)
+		stats.elements += n
+		stats.bytes += n * size + len(sequence.trailer)
+
+#Record the progress of a run in the checkpoint file 'path': the command line it was started with (without
+#the program name), the index of the next element to write, the bytes written so far and whether the run
+#is over.  The record is written to a temporary file first and renamed over the old one, so a run killed
+#part way through leaves either the old record or the new one.  The arguments are stored as latin-1, which
+#keeps every byte of them whatever their encoding.
+def save_checkpoint(path, args, position, size, done=False):
+	import json
+
+	args = [arg.decode('latin-1') for arg in args]
+
+	temporary = path + '.tmp'
+	out = open_output(temporary)
+	try:
+		json.dump({'args': args, 'next': position, 'bytes': size, 'done': done}, out)
+		out.flush()
+		os.fsync(out.fileno())
+	finally:
+		out.close()
+	try:
+		os.rename(temporary, path)
+	except OSError as error:
+		raise SequError(path + ": Error, " + error.strerror)
+
+#Read back the record save_checkpoint wrote to 'path'
+def load_checkpoint(path):
+	import json
+
+	try:
+		stream = open(path, 'rb')
+	except IOError as error:
+		raise SequError(path + ": Error, " + error.strerror)
+	try:
+		try:
+			record = json.load(stream)
+			record['args'] = [arg.encode('latin-1') for arg in record['args']]
+		except (ValueError, TypeError, KeyError, AttributeError, UnicodeError):
+			raise SequError(path + ": Error, not a checkpoint file")
+	finally:
+		stream.close()
+
+	if not (isinstance(record.get('next'), (int, long)) and isinstance(record.get('bytes'), (int, long))
+			and isinstance(record.get('done'), bool)):
+		raise SequError(path + ": Error, not a checkpoint file")
+	return record
+
+#Write the elements from start up to stop (None for the end) of 'sequence' to 'stream' (stdout by default),
+#followed by the trailer, recording the progress in the checkpoint file 'path' as it goes (see
+#save_checkpoint).  'args' is the command line to record and 'size' the bytes written before 'start'.  The
+#elements are written in blocks of about parallel_block_size bytes; the stream is flushed after each one,
+#and the position saved if checkpoint_interval seconds have passed since it last was, so the record never
+#runs ahead of what has been written.  With 'stats' the time spent is added to it.
+def write_checkpointed(sequence, path, args, stream=None, start=0, stop=None, size=0, buffer_size=None, stats=None):
+	if stream is None:
+		stream = sys.stdout
+
+	k, n, blank = sequence.span(start, stop)
+	saved = time.time()
+	save_checkpoint(path, args, k, size)
+
+	for first, last in split_blocks(sequence, k, k + n, parallel_block_size):
+		chunks = list(sequence.body_chunks(buffer_size, first, last, stats))
+		write_chunks(chunks, stream, stats)
+		stream.flush()
+		size += sum(imap(len, chunks))
+
+		if time.time() - saved >= checkpoint_interval:
+			save_checkpoint(path, args, last, size)
+			saved = time.time()
+
+	write_chunks([sequence.trailer], stream, stats)
+	stream.flush()
+	save_checkpoint(path, args, k + n, size + len(sequence.trailer), True)
+
+#Name of the file the cache option keeps the output of the elements from start up to stop of 'sequence' in.
+#It is a hash of everything the output depends on, taken from the sequence once its arguments are checked
+#and converted, so different ways of writing the same sequence (1 and 01, say) share a file.
+def cache_name(sequence, start=0, stop=None):
+	import hashlib
+
+	k, n, blank = sequence.span(start, stop)
+	key = ('sequ cache 1', sequence.format_word, sequence.start, sequence.inc, k, n, getattr(sequence, 'prec', None),
+		getattr(sequence, 'form', None), sequence.sep, sequence.equal_width, sequence.padded, sequence.pad,
+		sequence.width, sequence.trailer)
+	return hashlib.sha1(repr(key)).hexdigest() + '.out'
+
+#Find the sendfile function the first time it is asked for: os.sendfile under python 3, or the one from the
+#pysendfile package.  Returns None if there is neither.
+def load_sendfile():
+	global sendfile_cache
+
+	if sendfile_cache is False:
+		sendfile_cache = getattr(os, 'sendfile', None)
+		if sendfile_cache is None:
+			try:
+				from sendfile import sendfile
+				sendfile_cache = sendfile
+			except ImportError:
+				pass
+
+	return sendfile_cache
+
+#Write the 'size' bytes of the file 'source' to 'stream'.  When the stream is a file descriptor and sendfile
+#is available the kernel copies them, without passing through python; otherwise they are read and written
+#in large blocks.
+def send_file(source, stream, size):
+	sendfile = load_sendfile()
+	try:
+		fd = stream.fileno()
+	except (AttributeError, IOError, ValueError):
+		fd = None
+
+	sent = 0
+	if sendfile is not None and fd is not None:
+		stream.flush()
+		try:
+			while sent < size:
+				count = sendfile(fd, source.fileno(), sent, size - sent)
+				if count == 0:
+					break
+				sent += count
+		except OSError as error:
+			#Not every kind of file can be sent to; copy what is left instead
+			if error.errno not in [errno.EINVAL, errno.ENOSYS]:
+				raise
+
+	source.seek(sent)
+	while True:
+		block = source.read(16 * output_buffer_size)
+		if not block:
+			break
+		stream.write(block)
+
+#Remove the outputs used longest ago from the cache 'directory' until it holds at most max_size bytes, along
+#with files left half written by runs that were killed.  Processes sharing the directory take turns, by
+#locking a file in it; one process removing a file another is sending is harmless, as the one sending
+#already has it open.
+def trim_cache(directory, max_size):
+	import fcntl
+
+	lock = open(os.path.join(directory, '.lock'), 'ab')
+	try:
+		fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+
+		entries = []
+		for name in os.listdir(directory):
+			path = os.path.join(directory, name)
+			try:
+				info = os.stat(path)
+				if name.startswith('.tmp-') and info.st_mtime < time.time() - cache_stale_seconds:
+					os.remove(path)
+			except OSError:
+				continue #removed by another process
+			if name.endswith('.out'):
+				entries.append((info.st_mtime, info.st_size, path))
+
+		total = sum(size for used, size, path in entries)
+		for used, size, path in sorted(entries):
+			if total <= max_size:
+				break
+			try:
+				os.remove(path)
+			except OSError:
+				pass
+			total -= size
+	finally:
+		lock.close()
+
+#Pass the strings of 'chunks' on, copying them to the file 'out' too while it stays under max_size bytes.
+#'stored' is set to False once it has gone over.
+def storing_chunks(chunks, out, max_size, stored):
+	size = 0
+	for chunk in chunks:
+		if stored[0]:
+			size += len(chunk)
+			if size > max_size:
+				stored[0] = False
+			else:
+				out.write(chunk)
+		yield chunk
+
+#Write the output of the elements from start up to stop (None for the end) of 'sequence' to 'stream' (stdout
+#by default) for the cache option, from the file in the cache 'directory' named after the sequence (see
+#cache_name) if there is one.  Using it marks it as used, for trim_cache.  Otherwise the output is taken
+#from 'chunks' (which are not looked at on a hit) and written to a temporary file as it goes, which is renamed
+#into place once it is complete, so other processes only ever see whole files; then the directory is trimmed
+#to max_size bytes (cache_max_bytes by default).  With 'stats' the time spent writing and the bytes written
+#are added to it.
+def write_cached(sequence, directory, chunks, stream=None, start=0, stop=None, max_size=None, stats=None):
+	import tempfile
+
+	if stream is None:
+		stream = sys.stdout
+	if max_size is None:
+		max_size = cache_max_bytes
+
+	try:
+		os.makedirs(directory)
+	except OSError as error:
+		if error.errno != errno.EEXIST:
+			raise SequError(directory + ": Error, " + error.strerror)
+	path = os.path.join(directory, cache_name(sequence, start, stop))
+
+	try:
+		cached = open(path, 'rb')
+	except IOError:
+		cached = None
+	if cached is not None:
+		if hasattr(chunks, 'close'):
+			chunks.close()
+		try:
+			try:
+				os.utime(path, None)
+			except OSError:
+				pass #removed since it was opened, which leaves what was opened
+			size = os.fstat(cached.fileno()).st_size
+			started = time.time()
+			send_file(cached, stream, size)
+			if stats is not None:
+				stats.add('write', time.time() - started)
+				stats.elements += sequence.span(start, stop)[1]
+				stats.bytes += size
+		finally:
+			cached.close()
+		return
+
+	try:
+		fd, temporary = tempfile.mkstemp('', '.tmp-', directory)
+	except OSError as error:
+		raise SequError(directory + ": Error, " + error.strerror)
+	out = os.fdopen(fd, 'wb')
+	stored = [True]
+	try:
+		try:
+			write_chunks(storing_chunks(chunks, out, max_size, stored), stream, stats)
+		finally:
+			out.close()
+		if stored[0]:
+			os.chmod(temporary, 0o644) #mkstemp makes it readable by its owner only
+			os.rename(temporary, path)
+	finally:
+		if os.path.exists(temporary):
+			os.remove(temporary)
+
+	if stored[0]:
+		trim_cache(directory, max_size)
+
+#Lazily generate the elements of a sequence as strings.  Takes the same arguments as Sequence, e.g.
+#iter_sequence(1, 10, 2, equal_width=True) or iter_sequence('i', 'x', format_word='roman').
+def iter_sequence(first, last, increment=None, **options):
+	return iter(Sequence(first, last, increment, **options))
+
+#Lazily generate the output of a sequence, exactly as the command line writes it, in pieces of about
+#buffer_size bytes.  Takes the same arguments as Sequence.  With 'stats' (a Stats) the time spent
+#generating and formatting is added to it, as for the stats option.
+def iter_chunks(first, last, increment=None, buffer_size=None, stats=None, **options):
+	return Sequence(first, last, increment, **options).chunks(buffer_size, stats=stats)
+
+#Return the element with index k (counting from 0) of a sequence, computed directly from First and
+#Increment.  Takes the same arguments as Sequence.
+def nth_element(k, first, last, increment=None, **options):
+	return Sequence(first, last, increment, **options).element(k)
+
+#Lazily number 'lines', like the number-lines option.  line_count is only needed for the
+#equal-width and pad options.  Takes the same options as Sequence.
+def iter_numbered(lines, first, increment, line_count=None, sep=' ', **options):
+	return Sequence(first, line_count, increment, sep=sep, numbered=True, **options).number(lines)
+
+##################################################################################
+
+#Print the number of elements and/or bytes for the elements and bytes options, one to a line
+def print_totals(show_elements, show_bytes, elements, size, out=None):
+	if show_elements:
+		print >>out, elements
+	if show_bytes:
+		print >>out, size
+
+#Build a Sequence, or take it from sequence_cache when serving.  Sequences that number lines are never
+#cached, since the number of lines is set on them.
+def cached_sequence(*args):
+	if sequence_cache is None:
+		return Sequence(*args)
+
+	sequence = sequence_cache.get(args)
+	if sequence is None:
+		sequence = Sequence(*args)
+		if len(sequence_cache) >= sequence_cache_size:
+			sequence_cache.clear()
+		sequence_cache[args] = sequence
+	return sequence
+
+#Standard output or error of a request to the server.  Everything written is sent to the client as a
+#frame: one byte for the kind ('o' output, 'e' error output, 'x' exit status), four bytes of length
+#(big-endian) and the data.
+class FrameWriter(object):
+	def __init__(self, connection, kind):
+		self.connection = connection
+		self.kind = kind
+
+	def write(self, data):
+		import struct
+
+		if data:
+			self.connection.sendall(self.kind + struct.pack('>I', len(data)))
+			self.connection.sendall(data)
+
+	def flush(self):
+		pass
+
+#Run the server for the serve option on the unix socket 'path'.  Each client connection carries one
+#request: a line holding a JSON list of the arguments (as the command line would get them, without the
+#program name), then the input to number, if any, up to the end of the client's side of the connection.
+#The output comes back as frames (see FrameWriter), ending with the exit status.  Clients are served
+#by a thread each, sharing the roman numeral tables, numpy and the sequences built so far.
+def serve(path):
+	import SocketServer
+	import socket
+	import json
+	global sequence_cache
+
+	class RequestHandler(SocketServer.StreamRequestHandler):
+		def handle(self):
+			out = FrameWriter(self.connection, 'o')
+			try:
+				try:
+					args = json.loads(self.rfile.readline())
+					argv = ['sequ'] + [arg.encode('utf-8') for arg in args]
+				except (ValueError, TypeError, AttributeError):
+					print >>out, "Usage error: bad request"
+					status = 1
+				else:
+					status = serve_request(argv, out, self.rfile, FrameWriter(self.connection, 'e'))
+				FrameWriter(self.connection, 'x').write(str(status))
+			except socket.error:
+				pass #the client has gone
+
+	class Server(SocketServer.ThreadingMixIn, SocketServer.UnixStreamServer):
+		daemon_threads = True
+
+	#Take over a socket file left behind, but not one a server is still listening on
+	if os.path.exists(path):
+		probe = socket.socket(socket.AF_UNIX)
+		try:
+			probe.connect(path)
+		except socket.error:
+			os.remove(path)
+		else:
+			raise SequError(path + ": Error, a server is already running there")
+		finally:
+			probe.close()
+
+	sequence_cache = {}
+	roman_tables()
+	alpha_tables()
+	load_numpy()
+
+	server = Server(path, RequestHandler)
+	try:
+		server.serve_forever()
+	except KeyboardInterrupt:
+		pass
+	finally:
+		server.server_close()
+		os.remove(path)
+
+	return 0
+
+#Run one request for the server, the way main() runs the command line
+def serve_request(argv, stdout, stdin, stderr):
+	if len(argv) > 1 and argv[1] == '--serve':
+		print >>stdout, "Usage error: serve can not be used by a client"
+		return 1
+
+	try:
+		return run_command(argv, stdout, stdin, stderr)
+	except SequError as error:
+		print >>stdout, error
+		return 1
+
+#Write the elements from start up to stop of 'sequence' for the checkpoint option, to the file 'output_path'
+#or else to 'stdout'.  'resume' is the record of the run being carried on, or None to begin one: the
+#elements go on from the one after the last recorded, and an output file is cut back to the bytes recorded
+#as written, dropping anything written after the record was saved.
+def run_checkpointed(sequence, path, argv, resume, output_path, stdout, start, stop, buffer_size, stats):
+	args = argv[1:]
+	size = 0
+	if resume is not None:
+		if resume['done']:
+			return
+		start = resume['next']
+		size = resume['bytes']
+
+	if output_path is None:
+		write_checkpointed(sequence, path, args, stdout, start, stop, size, buffer_size, stats)
+		return
+
+	try:
+		if resume is None:
+			out = open(output_path, 'wb')
+		else:
+			out = open(output_path, 'r+b')
+			out.truncate(size)
+			out.seek(size)
+	except IOError as error:
+		raise SequError(output_path + ": Error, " + error.strerror)
+	try:
+		write_checkpointed(sequence, path, args, out, start, stop, size, buffer_size, stats)
+	finally:
+		out.close()
+
+#Split a line of a batch file into the words of its command line, quoted as a shell would
+def batch_words(line):
+	import shlex
+
+	try:
+		return shlex.split(line)
+	except ValueError as error:
+		raise SequError("Usage error: " + str(error) + ": " + line.strip())
+
+#Run the command line on the line 'line' of a batch (without the program name), writing its output and any
+#error, a line that can not be split included, to 'stdout'.  Returns the exit status.  'parallel' is set when
+#it runs in a worker process, which can not start processes of its own.
+def run_batch_spec(line, stdout, stderr, parallel=False):
+	try:
+		words = batch_words(line)
+		if words and words[0] in ['--serve', '--resume']:
+			raise SequError("Usage error: " + words[0] + " can not be used in a batch")
+		options, args, files = parse_command_line(['sequ'] + words)
+		for option, value in options:
+			if option in ['number-lines', 'batch'] or (parallel and option in ['jobs', 'split-lines']):
+				raise SequError("Usage error: " + option + " can not be used in a batch")
+		return run_command(['sequ'] + words, stdout, None, stderr)
+	except SequError as error:
+		print >>stdout, error
+		return 1
+
+#Run one line of a batch in a worker process of run_batch.  Returns its exit status, its output and its error
+#output (the stats report, say).
+def run_batch_block(line):
+	import cStringIO
+
+	out = cStringIO.StringIO()
+	err = cStringIO.StringIO()
+	status = run_batch_spec(line, out, err, True)
+	return status, out.getvalue(), err.getvalue()
+
+#Set up a worker process of run_batch, keeping the sequences it builds like the server does
+def init_batch_worker():
+	global sequence_cache
+	sequence_cache = {}
+
+#Print the sequences of a batch for the batch option: 'source' names the file holding a command line (the
+#options and arguments, quoted as for a shell) on each line, or is - for 'stdin'.  Blank lines are skipped.
+#The outputs are written to 'stdout' in order, with 'delimiter' between them.  The sequences built, and the
+#letter and roman numeral tables, are kept from one line to the next, so lines only pay for what differs.
+#With 'jobs' above 1 the lines are run in that many worker processes and their outputs gathered in order.
+#Returns 1 if any line failed (its error message is printed in place of its output), otherwise 0.
+def run_batch(source, delimiter, jobs=None, stdout=None, stdin=None, stderr=None):
+	global sequence_cache
+
+	if stdout is None:
+		stdout = sys.stdout
+	if stderr is None:
+		stderr = sys.stderr
+
+	if source == '-':
+		stream = stdin
+		if stream is None:
+			stream = sys.stdin
+	else:
+		try:
+			stream = open(source, 'rb')
+		except IOError as error:
+			raise SequError(source + ": Error, " + error.strerror)
+
+	if sequence_cache is None:
+		sequence_cache = {}
+
+	specs = (line for line in stream if line.strip())
+	status = 0
+	pool = None
+	try:
+		if jobs is not None and jobs > 1:
+			import multiprocessing #slow to import, and only needed here
+			pool = multiprocessing.Pool(jobs, init_batch_worker)
+			results = pool.imap(run_batch_block, specs, 16)
+		else:
+			results = None
+
+		for i, spec in enumerate(specs if results is None else results):
+			if i > 0:
+				stdout.write(delimiter)
+			if results is None:
+				spec_status = run_batch_spec(spec, stdout, stderr)
+			else:
+				spec_status, text, error_text = spec
+				stdout.write(text)
+				if error_text:
+					stdout.flush()
+					stderr.write(error_text)
+			status = max(status, spec_status)
+	finally:
+		if pool is not None:
+			pool.terminate()
+		if stream is not stdin and stream is not sys.stdin:
+			stream.close()
+
+	stdout.flush()
+	return status
+
+#Run sequ with the command line 'argv' (argv by default).  Returns the exit status.
+def main(argv=None):
+	if argv is None:
+		argv = sys.argv
+
+	try:
+		return run_command(argv)
+	except SequError as error:
+		print error
+		return 1
+	except IOError as error:
+		if error.errno != errno.EPIPE:
+			raise
+		return closed_output()
+
+#Finish quietly after the reader of standard output has gone away (head, for one), exiting with the status
+#a process killed by SIGPIPE would have.  Standard output is pointed at /dev/null, so python does not fail
+#again flushing it on the way out.
+def closed_output():
+	import signal
+
+	devnull = os.open(os.devnull, os.O_WRONLY)
+	os.dup2(devnull, sys.stdout.fileno())
+	os.close(devnull)
+	return 128 + signal.SIGPIPE
+
+#Parse the command line and print the sequence.  Errors are raised as SequError.  The output goes to
+#'stdout', lines to number come from 'stdin' and stats go to 'stderr' (the process's own by default).
+def run_command(argv, stdout=None, stdin=None, stderr=None): 
+	started = time.time() #for the stats option
+
+	default_seperator = '\n'
+	default_increment = None #the sequence works out the default for the format word
+	default_pad = ' '
+	
+	num_cmd_line_args = len(argv) #total number of command line arguments
+	seperator = default_seperator #string used between numbers
+	increment = default_increment #Increment value
+	is_equal_width = False #Is the equal width option used?
+	form_str = None #format string, worked out from the arguments if not given
+	is_padded = False #Is the padded option used?
+	pad = default_pad #pad string
+	format_word = None #format-word provided by option, or inferred from arguments
+	is_numbered = False #Is there a file to be numbered?
+	buffer_size = None #bytes written at a time, output_buffer_size if not given
+	
+	skip = 0 #number of elements to leave out at the start
+	limit = None #largest number of elements to print
+	jobs = None #number of processes formatting the sequence, or of files numbered at once
+	split_lines = None #number of elements in each file when splitting the output
+	output_prefix = None #start of the names of the split files
+	output_path = None #file to write the output to, instead of standard output
+	output_suffix = None #added to the name of each numbered file to name its output
+	show_elements = False #Print the number of elements instead of the sequence?
+	show_bytes = False #Print the size of the output instead of the sequence?
+	stats = None #timings and counts to report, if the stats option is used
+	checkpoint_path = None #file to record the progress of the run in
+	resume = None #the checkpoint record of the run being carried on, if resuming
+	compress = None #compression method for the output file, if any
+	pipeline = None #chunks the formatting thread may be ahead of the writing, if the output is pipelined
+	cache_dir = None #directory to keep the output in, if the cache option is used
+	cache_size = None #most bytes to keep there, cache_max_bytes if not given
+	
+	first = " " #The first argument (start)
+	second = None #the second argument (end)
+	
+	#No arguments were sent in
+	if num_cmd_line_args < 2:
+		raise SequError("Usage error: no arguments\nTry sequ -h for instructions")
+
+	#Serving takes the socket and nothing else
+	if argv[1] == '--serve':
+		if num_cmd_line_args != 3:
+			raise SequError("Usage error: sequ --serve socket\nTry sequ -h for instructions")
+		return serve(argv[2])
+
+	#Resuming takes the checkpoint file and nothing else; the command line is the one recorded in it
+	if argv[1] == '--resume':
+		if num_cmd_line_args != 3:
+			raise SequError("Usage error: sequ --resume checkpoint\nTry sequ -h for instructions")
+		checkpoint_path = argv[2]
+		resume = load_checkpoint(checkpoint_path)
+		if len(resume['args']) == 0 or resume['args'][0] in ['--serve', '--resume']:
+			raise SequError(checkpoint_path + ": Error, not a checkpoint file")
+		argv = [argv[0]] + resume['args']
+		num_cmd_line_args = len(argv)
+	
+	options, args, files = parse_command_line(argv)
+	arg_count = len(args)
+
+	#A batch takes its sequences from a file, and only the options about running them
+	batch_options = dict(options)
+	if 'batch' in batch_options:
+		if arg_count > 0 or files or not set(batch_options) <= set(['batch', 'delimiter', 'jobs']):
+			raise SequError("Usage error: batch only takes the delimiter and jobs options\nTry sequ -h for instructions")
+		if batch_options['batch'] is None:
+			raise SequError("Usage error: batch needs a file\nTry sequ -h for instructions")
+		jobs = batch_options.get('jobs')
+		if jobs is not None and not (is_int(jobs) and int(jobs) > 0):
+			raise SequError(jobs + ": Invalid number of jobs.")
+		if jobs is not None:
+			jobs = int(jobs)
+		return run_batch(batch_options['batch'], batch_options.get('delimiter') or '', jobs, stdout, stdin, stderr)
+	
+	#Special case where user only wants to see version or help
+	if len(options) == 1 and arg_count == 0:
+		if version_check(argv[1]):
+			print_version(stdout)
+			return 0
+		if help_check(argv[1]):
+			print_help(stdout)
+			return 0
+	
+	#If the number of arguments is not 2 or 3, get out!
+	if arg_count < 2 or arg_count > 3:
+		raise SequError("Usage error: Incorrect number of arguments\nTry sequ -h for instructions")
+	
+			
+	#process the options, if there are any, then print the right sequence of numbers
+	for option, value in options:
+		if option == 'help':
+			print_help(stdout)
+			return 0
+	
+		elif option == 'version':
+			print_version(stdout)
+			return 0
+	
+		elif option == 'seperator':
+			seperator = value
+	
+		elif option == 'equal-width':
+			is_padded = False
+			is_equal_width = True
+	
+		elif option == 'format':
+			form_str = value
+	 
+		elif option == 'words':
+			seperator = ' '
+	
+		elif option == 'pad':
+			is_equal_width = False
+			is_padded = True
+			pad = value
+			if len(pad) > 1:
+				raise SequError(str(pad) + ": Invalid pad, must be single character.")
+	
+		elif option == 'pad-spaces':
+			is_equal_width = False
+			is_padded = True
+			pad = default_pad
+	
+		elif option == 'format-word':
+			if value in ['arabic', 'floating', 'alpha', 'ALPHA', 'roman', 'ROMAN']:
+				format_word = value
+			else:
+				raise SequError(value + ": Invalid format word.")
+		
+		elif option == 'buffer-size':
+			if is_int(value) and int(value) > 0:
+				buffer_size = int(value)
+			else:
+				raise SequError(value + ": Invalid buffer size.")
+
+		elif option == 'skip' or option == 'count':
+			if not (is_int(value) and int(value) >= 0):
+				raise SequError(value + ": Invalid number of elements.")
+			if option == 'skip':
+				skip = int(value)
+			else:
+				limit = int(value)
+
+		elif option == 'jobs':
+			if is_int(value) and int(value) > 0:
+				jobs = int(value)
+			else:
+				raise SequError(value + ": Invalid number of jobs.")
+
+		elif option == 'split-lines':
+			if is_int(value) and int(value) > 0:
+				split_lines = int(value)
+			else:
+				raise SequError(value + ": Invalid number of lines.")
+
+		elif option == 'output-prefix':
+			output_prefix = value
+
+		elif option == 'output':
+			output_path = value
+
+		elif option == 'output-suffix':
+			output_suffix = value
+
+		elif option == 'elements':
+			show_elements = True
+
+		elif option == 'bytes':
+			show_bytes = True
+
+		elif option == 'stats':
+			stats = Stats(started)
+
+		elif option == 'cache':
+			cache_dir = value
+
+		elif option == 'cache-size':
+			if is_int(value) and int(value) >= 0:
+				cache_size = int(value)
+			else:
+				raise SequError(value + ": Invalid cache size.")
+
+		elif option == 'pipeline':
+			if is_int(value) and int(value) > 0:
+				pipeline = int(value)
+			else:
+				raise SequError(value + ": Invalid pipeline depth.")
+
+		elif option == 'compress':
+			check_compression(value)
+			compress = value
+
+		elif option == 'checkpoint':
+			#A resumed run keeps recording in the file it was resumed from
+			if resume is None:
+				checkpoint_path = value
+
+		elif option == 'number-lines':
+			if arg_count > 2:
+				raise SequError("Usage error: Too many arguments for number-lines option")
+			
+			if seperator == default_seperator:
+				seperator = ' '
+	
+			is_numbered = True
+	
+	#Assign arguments to the proper variables
+	if arg_count == 2 and not is_numbered:
+		first, second = args
+	
+	elif arg_count == 2 and is_numbered:
+		first, increment = args
+	
+	elif arg_count == 3:
+		first, increment, second = args
+
+	#Only pass the pad string on if a pad option is in effect
+	if not is_padded:
+		pad = None
+
+	if is_numbered and (skip > 0 or limit is not None):
+		raise SequError("Usage error: skip and count can not be used with number-lines")
+	if output_suffix is not None and not files:
+		raise SequError("Usage error: output-suffix is only for numbering files")
+	if output_suffix == '':
+		raise SequError("Usage error: output-suffix can not be empty, that would write over the files")
+	if output_suffix is not None and output_path is not None:
+		raise SequError("Usage error: output can not be used with output-suffix")
+	if (split_lines is None) != (output_prefix is None):
+		raise SequError("Usage error: split-lines and output-prefix must be used together")
+	if is_numbered and split_lines is not None:
+		raise SequError("Usage error: split-lines can not be used with number-lines")
+	if split_lines is not None and output_path is not None:
+		raise SequError("Usage error: output can not be used with split-lines")
+	if checkpoint_path is not None and (is_numbered or split_lines is not None or jobs is not None):
+		raise SequError("Usage error: checkpoint can not be used with number-lines, split-lines or jobs")
+	if compress is not None and output_path is None:
+		raise SequError("Usage error: compress can only be used with output")
+	if compress is not None and checkpoint_path is not None:
+		raise SequError("Usage error: compress can not be used with checkpoint")
+	if cache_dir is not None and (is_numbered or split_lines is not None or output_path is not None or checkpoint_path is not None):
+		raise SequError("Usage error: cache can only be used to print a sequence to the output")
+	if cache_size is not None and cache_dir is None:
+		raise SequError("Usage error: cache-size needs the cache option")
+
+	#At this point we have all the information needed to print the sequence.  Hand it over and go!
+	if is_numbered:
+		sequence = Sequence(first, None, increment, format_word, form_str, seperator, is_equal_width, pad, True)
+		if stats is not None:
+			stats.add('parse', time.time() - started)
+			started = time.time()
+
+		if show_elements or show_bytes:
+			if files:
+				totals = [numbered_file_size(sequence, path) for path in files]
+				print_totals(show_elements, show_bytes, sum(lines for lines, size in totals), sum(size for lines, size in totals), stdout)
+			else:
+				if stdin is None:
+					import io
+					stdin = io.open(sys.stdin.fileno(), 'rb', closefd=False)
+				num_file_lines, input_size = numbered_size(sequence, stdin)
+				print_totals(show_elements, show_bytes, num_file_lines, input_size, stdout)
+			return 0
+
+		out = stdout
+		if output_path is not None:
+			if files:
+				check_output_not_input(output_path, files)
+			elif stdin is None:
+				check_output_not_input(output_path, [], sys.stdin)
+			else:
+				check_output_not_input(output_path, [], stdin)
+			out = open_output(output_path)
+
+		if files and output_suffix is not None:
+			number_files_to(sequence, files, output_suffix, jobs, buffer_size, stats)
+		else:
+			if files:
+				chunks = queued_file_chunks(sequence, files, jobs, buffer_size, stats)
+			else:
+				if stdin is None:
+					import io
+					stdin = io.open(sys.stdin.fileno(), 'rb', closefd=False)
+
+				#A regular file can be split up between processes by jobs; a pipe is read in order
+				if jobs is not None and jobs > 1 and stat.S_ISREG(os.fstat(stdin.fileno()).st_mode):
+					chunks = parallel_numbered_chunks(sequence, stdin, jobs, None, stats)
+				else:
+					#Get ready to read the lines to be numbered.  Their number is only needed to work out the width.
+					file_contents, num_file_lines = read_numbered_input(sequence.needs_length(), stdin)
+					sequence.set_length(num_file_lines)
+
+					if stats is not None:
+						stats.add('read', time.time() - started)
+					chunks = numbered_chunks(sequence, file_contents, buffer_size, stats)
+
+			if compress is not None:
+				chunks = compressed_chunks(chunks, compress, stats=stats)
+			if pipeline is not None:
+				chunks = pipelined_chunks(chunks, pipeline)
+			write_chunks(chunks, out, stats)
+
+		if output_path is not None:
+			out.close()
+	else:
+		if limit is None:
+			stop = None
+		else:
+			stop = skip + limit
+
+		sequence = cached_sequence(first, second, increment, format_word, form_str, seperator, is_equal_width, pad)
+		if stats is not None:
+			stats.add('parse', time.time() - started)
+
+		#Without the jobs option shards are written by one process per CPU, and everything else by one process
+		if jobs is None and split_lines is None:
+			jobs = 1
+
+		if show_elements or show_bytes:
+			k, n, blank = sequence.span(skip, stop)
+			print_totals(show_elements, show_bytes, n, sequence.output_bytes(skip, stop), stdout)
+		elif checkpoint_path is not None:
+			run_checkpointed(sequence, checkpoint_path, argv, resume, output_path, stdout, skip, stop, buffer_size, stats)
+		elif split_lines is not None:
+			write_shards(sequence, split_lines, output_prefix, jobs, skip, stop, stats)
+		elif output_path is not None:
+			write_output(sequence, output_path, jobs, skip, stop, stats, buffer_size, compress)
+		else:
+			if jobs > 1:
+				chunks = parallel_chunks(sequence, jobs, skip, stop, None, stats)
+			else:
+				chunks = sequence.chunks(buffer_size, skip, stop, stats)
+			if pipeline is not None:
+				chunks = pipelined_chunks(chunks, pipeline)
+			if cache_dir is not None:
+				write_cached(sequence, cache_dir, chunks, stdout, skip, stop, cache_size, stats)
+			else:
+				write_chunks(chunks, stdout, stats)
+
+	if stats is not None:
+		stats.report(stderr)
+	return 0
+	
+# End of main